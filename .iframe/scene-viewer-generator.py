@@ -6,10 +6,60 @@ Creates HTML wrapper files for embedding ESRI Scene Viewer URLs
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+from concurrent.futures import ThreadPoolExecutor
+import html
 import os
 import subprocess
 import sys
 
+# Output buffer size for generated HTML files
+HTML_WRITE_BUFFER_SIZE = 1 << 20
+
+# Background worker for file system work, so slow (e.g. network) folders
+# don't freeze the GUI
+_io_executor = ThreadPoolExecutor(max_workers=1)
+
+# How often the Tk thread checks whether a background write has finished
+WRITE_POLL_INTERVAL_MS = 50
+
+
+# Generated page, split around the iframe's src attribute value
+_HTML_PREFIX = b"""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>ESRI Scene Viewer</title>
+    <style>
+        body {
+            margin: 0;
+            padding: 0;
+            overflow: hidden;
+        }
+        iframe {
+            width: 100vw;
+            height: 100vh;
+            border: none;
+        }
+    </style>
+</head>
+<body>
+    <iframe frameborder="0" scrolling="no" allowfullscreen src=\""""
+
+_HTML_SUFFIX = b"""\"></iframe>
+</body>
+</html>
+"""
+
+
+def _write_file(filepath, url):
+    """Write the wrapper page for url to filepath (runs on the I/O worker thread)"""
+    with open(filepath, 'wb', buffering=HTML_WRITE_BUFFER_SIZE) as f:
+        f.write(_HTML_PREFIX)
+        f.write(html.escape(url, quote=True).encode('utf-8'))
+        f.write(_HTML_SUFFIX)
+
+
 class SceneViewerGenerator:
     def __init__(self, root):
         self.root = root
@@ -152,64 +202,55 @@ class SceneViewerGenerator:
             if not result:
                 return
 
-        # Generate HTML content
-        html_content = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>ESRI Scene Viewer</title>
-    <style>
-        body {{
-            margin: 0;
-            padding: 0;
-            overflow: hidden;
-        }}
-        iframe {{
-            width: 100vw;
-            height: 100vh;
-            border: none;
-        }}
-    </style>
-</head>
-<body>
-    <iframe frameborder="0" scrolling="no" allowfullscreen src="{url}"></iframe>
-</body>
-</html>
-"""
+        # Write file in the background; _on_write_done polls for the result
+        self.show_folder_btn.config(state='disabled')
+        self.status_label.config(text=f"Writing {filename}...", foreground='gray')
+
+        future = _io_executor.submit(_write_file, filepath, url)
+        self._on_write_done(future, filepath, filename)
+
+    def _on_write_done(self, future, filepath, filename):
+        """Report the result of a background write (runs on the Tk thread)"""
+        # Polled from the Tk event loop: Tkinter isn't safe to call from the
+        # worker thread, so a done-callback can't schedule this itself
+        if not future.done():
+            self.root.after(WRITE_POLL_INTERVAL_MS, self._on_write_done,
+                            future, filepath, filename)
+            return
 
-        # Write file
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-
-            self.last_generated_file = filepath
-            self.show_folder_btn.config(state='normal')
-            self.status_label.config(
-                text=f"✓ Successfully created: {filename}",
-                foreground='green'
-            )
-
-            # Ask if user wants to open the file
-            result = messagebox.askyesno(
-                "Success",
-                f"HTML file created successfully!\n\nDo you want to open it in your browser?"
-            )
-            if result:
-                os.startfile(filepath)
-
+            future.result()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to create file: {str(e)}")
             self.status_label.config(
                 text=f"✗ Error: {str(e)}",
                 foreground='red'
             )
+            return
+
+        self.last_generated_file = filepath
+        self.show_folder_btn.config(state='normal')
+        self.status_label.config(
+            text=f"✓ Successfully created: {filename}",
+            foreground='green'
+        )
+
+        # Ask if user wants to open the file
+        result = messagebox.askyesno(
+            "Success",
+            f"HTML file created successfully!\n\nDo you want to open it in your browser?"
+        )
+        if result:
+            os.startfile(filepath)
 
     def show_in_folder(self):
         """Open File Explorer to the output location"""
         if self.last_generated_file and os.path.exists(self.last_generated_file):
-            # Open Explorer and select the file
-            subprocess.run(['explorer', '/select,', os.path.normpath(self.last_generated_file)])
+            # Open Explorer and select the file (can block on stale network shares)
+            _io_executor.submit(
+                subprocess.run,
+                ['explorer', '/select,', os.path.normpath(self.last_generated_file)]
+            )
         else:
             folder = self.folder_entry.get().strip()
             if os.path.exists(folder):
@@ -19,16 +19,18 @@ Requirements:
 """
 
 import argparse
+import os
 import sys
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional, Tuple
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from modules.obj_parser import OBJParser
 from modules.mtl_parser import MTLParser
-from modules.texture_processor import TextureProcessor, format_bytes
+from modules.texture_processor import TextureProcessor, format_bytes, PILLOW_SIMD
 from modules.html_generator import HTMLGenerator
 
 
@@ -58,21 +60,28 @@ def find_model_files(input_path: Path) -> dict:
             raise ValueError(f"Input file must be .obj, got: {input_path.suffix}")
 
     elif input_path.is_dir():
-        # Directory mode - find all OBJ files
-        result['obj_files'] = OBJParser.find_obj_files(input_path)
+        # Directory mode - classify OBJ, MTL and texture files in one scan
+        with os.scandir(input_path) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+
+                ext = os.path.splitext(entry.name)[1].lower()
+
+                if ext == '.obj':
+                    result['obj_files'].append(Path(entry.path))
+                elif ext == '.mtl':
+                    # Use the first MTL file found
+                    if result['mtl_file'] is None:
+                        result['mtl_file'] = Path(entry.path)
+                elif ext in TextureProcessor.SUPPORTED_FORMATS:
+                    result['texture_files'].append(Path(entry.path))
 
         if not result['obj_files']:
             raise FileNotFoundError(f"No .obj files found in: {input_path}")
 
-        # Look for MTL file
-        mtl_files = list(input_path.glob('*.mtl'))
-        if mtl_files:
-            result['mtl_file'] = mtl_files[0]
-
-        # Find all texture files
-        for ext in ['.jpg', '.jpeg', '.png', '.webp', '.bmp']:
-            result['texture_files'].extend(input_path.glob(f'*{ext}'))
-            result['texture_files'].extend(input_path.glob(f'*{ext.upper()}'))
+        result['obj_files'].sort()
+        result['texture_files'].sort()
 
     else:
         raise FileNotFoundError(f"Input path not found: {input_path}")
@@ -86,7 +95,9 @@ def generate_viewer(input_path: Path,
                    convert_to_webp: bool = False,
                    jpeg_quality: int = 85,
                    title: Optional[str] = None,
-                   verbose: bool = False) -> Path:
+                   verbose: bool = False,
+                   executor: Optional[Executor] = None,
+                   log: Callable[[str], None] = print) -> Path:
     """
     Generate standalone OBJ viewer HTML file.
 
@@ -98,61 +109,67 @@ def generate_viewer(input_path: Path,
         jpeg_quality: JPEG compression quality (1-100)
         title: Custom page title
         verbose: Print detailed progress
+        executor: Pool to process textures on, shared with other runs
+            (default: a pool of this run's own, when there are enough textures)
+        log: Called with each line of progress output (default: print)
 
     Returns:
         Path to generated HTML file
     """
-    print(f"🔍 Scanning for model files in: {input_path}")
+    log(f"🔍 Scanning for model files in: {input_path}")
 
     # Find all model files
     files = find_model_files(input_path)
 
-    print(f"✓ Found {len(files['obj_files'])} OBJ file(s)")
+    log(f"✓ Found {len(files['obj_files'])} OBJ file(s)")
     if files['mtl_file']:
-        print(f"✓ Found MTL file: {files['mtl_file'].name}")
+        log(f"✓ Found MTL file: {files['mtl_file'].name}")
     if files['texture_files']:
-        print(f"✓ Found {len(files['texture_files'])} texture file(s)")
+        log(f"✓ Found {len(files['texture_files'])} texture file(s)")
 
     # Parse OBJ files
-    print(f"\n📦 Processing OBJ geometry...")
+    log(f"\n📦 Processing OBJ geometry...")
     obj_parser = OBJParser()
 
     if len(files['obj_files']) == 1:
         obj_data = obj_parser.parse_file(files['obj_files'][0])
     else:
-        print(f"   Merging {len(files['obj_files'])} OBJ files...")
+        log(f"   Merging {len(files['obj_files'])} OBJ files...")
         obj_data = obj_parser.parse_files(files['obj_files'])
 
     stats = obj_parser.get_stats()
-    print(f"✓ Vertices: {stats['vertices']:,}")
-    print(f"✓ Faces: {stats['faces']:,}")
-    print(f"✓ Normals: {stats['normals']:,}")
-    print(f"✓ Texture Coords: {stats['texcoords']:,}")
+    log(f"✓ Vertices: {stats['vertices']:,}")
+    log(f"✓ Faces: {stats['faces']:,}")
+    log(f"✓ Normals: {stats['normals']:,}")
+    log(f"✓ Texture Coords: {stats['texcoords']:,}")
 
     # Parse MTL file
     mtl_data = ""
     mtl_parser = MTLParser()
-    texture_paths = set()
+    texture_paths = frozenset()
 
     if files['mtl_file']:
-        print(f"\n🎨 Processing materials...")
+        log(f"\n🎨 Processing materials...")
         mtl_parser.parse_file(files['mtl_file'])
-        print(f"✓ Materials: {len(mtl_parser.materials)}")
+        log(f"✓ Materials: {len(mtl_parser.materials)}")
 
         # Get texture paths from MTL
-        texture_paths = mtl_parser.get_all_texture_paths()
+        texture_paths = frozenset(mtl_parser.get_all_texture_paths())
 
         if texture_paths:
-            print(f"✓ Textures referenced: {len(texture_paths)}")
+            log(f"✓ Textures referenced: {len(texture_paths)}")
             if verbose:
                 for tex in texture_paths:
-                    print(f"    - {tex}")
+                    log(f"    - {tex}")
 
     # Process textures
     texture_data = {}
+    mtl_texture_data = {}  # MTL texture path -> data URI
 
     if files['texture_files'] or texture_paths:
-        print(f"\n🖼️  Processing textures...")
+        log(f"\n🖼️  Processing textures...")
+        if verbose:
+            log(f"   Image backend: {'Pillow-SIMD' if PILLOW_SIMD else 'Pillow'}")
 
         processor = TextureProcessor(
             max_resolution=max_texture_size,
@@ -160,56 +177,62 @@ def generate_viewer(input_path: Path,
             jpeg_quality=jpeg_quality
         )
 
-        # Match texture files to MTL references
-        textures_to_process = {}
-
-        for tex_path in files['texture_files']:
-            # Check if this texture is referenced in MTL
-            tex_name = tex_path.name
-            # Also check without directory paths
-            tex_basename = Path(tex_name).name
+        # Match texture files to MTL references by file name (MTL paths may
+        # include directories), keeping the MTL path(s) each one replaces
+        mtl_refs = {}
+        for mtl_path in texture_paths:
+            mtl_refs.setdefault(Path(mtl_path).name, []).append(mtl_path)
 
-            if tex_name in texture_paths or tex_basename in texture_paths:
-                textures_to_process[tex_name] = tex_path
-            elif not texture_paths:
-                # If no MTL, include all textures
-                textures_to_process[tex_name] = tex_path
+        if not texture_paths:
+            # If no MTL, include all textures
+            textures_to_process = {p.name: p for p in files['texture_files']}
+        else:
+            textures_to_process = {p.name: p for p in files['texture_files']
+                                   if p.name in mtl_refs}
 
         if not textures_to_process:
-            print("⚠️  Warning: No matching textures found for MTL references")
+            log("⚠️  Warning: No matching textures found for MTL references")
         else:
-            for tex_name, tex_path in textures_to_process.items():
-                print(f"   Processing: {tex_name}...")
-                result = processor.process_texture(tex_path)
+            for tex_name in textures_to_process:
+                log(f"   Processing: {tex_name}...")
 
+            # Spread over worker processes for larger batches; results come
+            # back in input order. A failed texture aborts the run.
+            results = processor.process_textures_batch(
+                list(textures_to_process.values()), raise_errors=True, executor=executor
+            )
+
+            for tex_name, result in results.items():
                 if verbose:
-                    print(f"      Original: {format_bytes(result['original_size'])}")
-                    print(f"      Encoded: {format_bytes(result['encoded_size'])}")
-                    print(f"      Dimensions: {result['original_dimensions']}")
+                    log(f"   {tex_name}:")
+                    log(f"      Original: {format_bytes(result['original_size'])}")
+                    log(f"      Encoded: {format_bytes(result['encoded_size'])}")
+                    log(f"      Dimensions: {result['original_dimensions']}")
                     if result['downscaled']:
-                        print(f"      Downscaled to: {result['dimensions']}")
+                        log(f"      Downscaled to: {result['dimensions']}")
 
-                # Use basename for texture reference
-                tex_key = Path(tex_name).name
-                texture_data[tex_key] = result['data_uri']
+                # tex_name is already the basename used for texture references
+                texture_data[tex_name] = result['data_uri']
+                for mtl_path in mtl_refs.get(tex_name, ()):
+                    mtl_texture_data[mtl_path] = result['data_uri']
 
             tex_stats = processor.get_stats_summary()
-            print(f"✓ Textures processed: {tex_stats['files_processed']}")
-            print(f"✓ Total size: {tex_stats['total_encoded_size_mb']:.2f} MB (Base64)")
+            log(f"✓ Textures processed: {tex_stats['files_processed']}")
+            log(f"✓ Total size: {tex_stats['total_encoded_size_mb']:.2f} MB (Base64)")
 
     # Update MTL with texture data URIs
-    if files['mtl_file'] and texture_data:
-        print(f"\n🔗 Updating material texture references...")
-        mtl_parser.update_texture_paths(texture_data)
+    if files['mtl_file'] and mtl_texture_data:
+        log(f"\n🔗 Updating material texture references...")
+        mtl_parser.update_texture_paths(mtl_texture_data)
 
     # Generate MTL string
     if files['mtl_file']:
         mtl_data = mtl_parser.to_mtl_string()
 
     # Generate HTML
-    print(f"\n📄 Generating HTML viewer...")
+    log(f"\n📄 Generating HTML viewer...")
 
-    generator = HTMLGenerator()
+    generator = HTMLGenerator.default()
 
     # Use input filename as default title if not provided
     if title is None:
@@ -218,7 +241,7 @@ def generate_viewer(input_path: Path,
         else:
             title = f"Terra Viewer - {input_path.name}"
 
-    output_file = generator.generate_obj_viewer(
+    output_file, output_size = generator.generate_obj_viewer(
         obj_data=obj_data,
         mtl_data=mtl_data,
         textures=texture_data,
@@ -226,17 +249,73 @@ def generate_viewer(input_path: Path,
         title=title
     )
 
-    output_size = output_file.stat().st_size
-    print(f"✓ Generated: {output_file}")
-    print(f"✓ File size: {format_bytes(output_size)}")
+    log(f"✓ Generated: {output_file}")
+    log(f"✓ File size: {format_bytes(output_size)}")
 
     if output_size > 50 * 1024 * 1024:  # 50 MB
-        print(f"⚠️  Warning: Large file size ({format_bytes(output_size)})")
-        print(f"   Consider using texture downscaling: --max-texture-size 2048")
+        log(f"⚠️  Warning: Large file size ({format_bytes(output_size)})")
+        log(f"   Consider using texture downscaling: --max-texture-size 2048")
 
     return output_file
 
 
+async def generate_viewer_async(input_path: Path,
+                                output_path: Path,
+                                **kwargs) -> Path:
+    """
+    Run generate_viewer in a worker thread.
+
+    Takes the same arguments as generate_viewer. Most of a run is PIL work
+    and large file reads/writes, so several models can overlap.
+    """
+    # Imported here: asyncio is slow to import and only batch callers need it
+    import asyncio
+
+    return await asyncio.to_thread(generate_viewer, input_path, output_path, **kwargs)
+
+
+async def generate_all(jobs: List[Tuple[Path, Path]],
+                       max_workers: Optional[int] = None,
+                       **kwargs) -> List[Path]:
+    """
+    Generate several viewers concurrently.
+
+    All jobs share one texture process pool, instead of each starting a pool
+    sized to the CPU count. Each model's progress output is collected and
+    printed as one block when that model finishes, so runs don't interleave.
+
+    Example:
+        asyncio.run(generate_all([(Path('flight1/'), Path('flight1.html')),
+                                  (Path('flight2/'), Path('flight2.html'))]))
+
+    Args:
+        jobs: List of (input_path, output_path) pairs
+        max_workers: Texture worker processes shared by all jobs
+            (default: CPU count)
+        **kwargs: Options passed to generate_viewer for every job
+
+    Returns:
+        Paths to generated HTML files, in job order
+    """
+    import asyncio
+    from concurrent.futures import ProcessPoolExecutor
+
+    async def run(input_path: Path, output_path: Path, executor: Executor) -> Path:
+        lines = []
+        try:
+            return await generate_viewer_async(input_path, output_path,
+                                               executor=executor, log=lines.append,
+                                               **kwargs)
+        finally:
+            print('\n'.join(lines))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return await asyncio.gather(
+            *(run(input_path, output_path, executor)
+              for input_path, output_path in jobs)
+        )
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -13,18 +13,63 @@ Supports:
 """
 
 from pathlib import Path
-from typing import Dict, Optional
+from typing import BinaryIO, Callable, Dict, List, Optional, Tuple, Union
 import json
+import os
 import re
 
+try:
+    import orjson  # Optional: faster JSON encoding for texture data
+except ImportError:
+    orjson = None
+
+
+# Buffer size for HTML output (and template reads). Generated viewers are
+# often tens of MB, so a large buffer keeps the write() syscall count low.
+HTML_WRITE_BUFFER_SIZE = 1 << 20
+
+# {{PLACEHOLDER}} markers in (UTF-8 encoded) templates
+_PLACEHOLDER_RE = re.compile(rb'\{\{([A-Z_]+)\}\}')
+
+
+def _fadvise(f, advice: int):
+    """Pass an access-pattern hint for an open file to the kernel, where supported."""
+    try:
+        os.posix_fadvise(f.fileno(), 0, 0, advice)
+    except OSError:
+        pass  # Hints are advisory only
+
 
 class HTMLGenerator:
     """Generate standalone HTML viewers from templates."""
 
+    # Characters that must be escaped inside a JavaScript template literal
+    _JS_ESCAPE_RE = re.compile(r'\\|`|\$\{')
+    _JS_ESCAPE_MAP = {'\\': '\\\\', '`': '\\`', '${': '\\${'}
+
+    # Escape and write large payloads in chunks of this many characters
+    _JS_ESCAPE_CHUNK_SIZE = 1 << 20
+
+    # HTML special characters, escaped in a single str.translate pass
+    _HTML_ESCAPE_TABLE = str.maketrans({
+        '&': '&amp;',
+        '<': '&lt;',
+        '>': '&gt;',
+        '"': '&quot;',
+        "'": '&#x27;',
+    })
+
+    # Parsed templates: path -> (st_mtime_ns, parts), see _load_template.
+    # Shared by all instances, so batch runs parse each template only once.
+    _template_cache: Dict[Path, Tuple[int, List[Union[bytes, str]]]] = {}
+
     def __init__(self, template_dir: Optional[Path] = None):
         """
         Initialize HTML generator.
 
+        The template directory is not checked here; a missing template
+        raises FileNotFoundError when a viewer is generated.
+
         Args:
             template_dir: Directory containing viewer templates.
                          Defaults to src/templates/
@@ -35,15 +80,21 @@ class HTMLGenerator:
         else:
             self.template_dir = Path(template_dir)
 
-        if not self.template_dir.exists():
-            raise FileNotFoundError(f"Template directory not found: {self.template_dir}")
+    @classmethod
+    def default(cls) -> 'HTMLGenerator':
+        """Get a shared generator for the default template directory."""
+        # One per class, so a subclass gets an instance of itself
+        generator = _default_generators.get(cls)
+        if generator is None:
+            generator = _default_generators[cls] = cls()
+        return generator
 
     def generate_obj_viewer(self,
                            obj_data: str,
                            mtl_data: str,
                            textures: Dict[str, str],
                            output_path: Path,
-                           title: str = "Terra 3D Model Viewer") -> Path:
+                           title: str = "Terra 3D Model Viewer") -> Tuple[Path, int]:
         """
         Generate standalone OBJ viewer HTML file.
 
@@ -55,7 +106,7 @@ class HTMLGenerator:
             title: Page title
 
         Returns:
-            Path to generated HTML file
+            Tuple of (path to generated HTML file, its size in bytes)
 
         Raises:
             FileNotFoundError: If template not found
@@ -65,33 +116,20 @@ class HTMLGenerator:
         if not template_path.exists():
             raise FileNotFoundError(f"OBJ template not found: {template_path}")
 
-        # Load template
-        with open(template_path, 'r', encoding='utf-8') as f:
-            html = f.read()
-
-        # Replace placeholders
-        html = html.replace('{{OBJ_DATA}}', self._escape_js_string(obj_data))
-        html = html.replace('{{MTL_DATA}}', self._escape_js_string(mtl_data))
-        html = html.replace('{{TEXTURE_DATA}}', json.dumps(textures, ensure_ascii=False))
-
-        # Update title if provided
-        if title:
-            html = html.replace('<title>Terra 3D Model Viewer (OBJ)</title>',
-                              f'<title>{self._escape_html(title)}</title>')
-
-        # Write output
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html)
+        # Stream template + data straight to disk (no full-size HTML string)
+        writers = {
+            'OBJ_DATA': lambda f: self._write_js_string(f, obj_data),
+            'MTL_DATA': lambda f: self._write_js_string(f, mtl_data),
+            'TEXTURE_DATA': lambda f: self._write_json(f, textures),
+        }
 
-        return output_path
+        return self._write_template(template_path, output_path, writers,
+                                    '<title>Terra 3D Model Viewer (OBJ)</title>', title)
 
     def generate_ply_viewer(self,
                            ply_data: str,
                            output_path: Path,
-                           title: str = "Terra Point Cloud Viewer") -> Path:
+                           title: str = "Terra Point Cloud Viewer") -> Tuple[Path, int]:
         """
         Generate standalone PLY viewer HTML file.
 
@@ -101,7 +139,7 @@ class HTMLGenerator:
             title: Page title
 
         Returns:
-            Path to generated HTML file
+            Tuple of (path to generated HTML file, its size in bytes)
 
         Raises:
             FileNotFoundError: If template not found
@@ -111,26 +149,90 @@ class HTMLGenerator:
         if not template_path.exists():
             raise FileNotFoundError(f"PLY template not found: {template_path}")
 
-        # Load template
-        with open(template_path, 'r', encoding='utf-8') as f:
-            html = f.read()
+        writers = {
+            'PLY_DATA': lambda f: self._write_js_string(f, ply_data),
+        }
 
-        # Replace placeholders
-        html = html.replace('{{PLY_DATA}}', self._escape_js_string(ply_data))
+        return self._write_template(template_path, output_path, writers,
+                                    '<title>Terra Point Cloud Viewer (PLY)</title>', title)
+
+    def _load_template(self, template_path: Path) -> List[Union[bytes, str]]:
+        """
+        Load template and split it on {{PLACEHOLDER}} markers.
+
+        Returns a list alternating UTF-8 encoded literal spans (even indices)
+        and placeholder names (odd indices). Parsed templates are cached per
+        path and reused until the file's modification time changes, so
+        repeated generation skips the read, decode and regex scan, and
+        literal spans are written to the output without re-encoding.
+        """
+        mtime_ns = template_path.stat().st_mtime_ns
+        cached = self._template_cache.get(template_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        with open(template_path, 'rb', buffering=HTML_WRITE_BUFFER_SIZE) as f:
+            if hasattr(os, 'posix_fadvise'):
+                _fadvise(f, os.POSIX_FADV_SEQUENTIAL)
+            parts = _PLACEHOLDER_RE.split(f.read())
+        parts[1::2] = [name.decode('ascii') for name in parts[1::2]]
+
+        self._template_cache[template_path] = (mtime_ns, parts)
+        return parts
+
+    def _write_template(self,
+                        template_path: Path,
+                        output_path: Path,
+                        writers: Dict[str, Callable[[BinaryIO], None]],
+                        title_tag: str,
+                        title: str) -> Tuple[Path, int]:
+        """
+        Write template to output, streaming placeholder values as they come.
+
+        Args:
+            template_path: Template to render
+            output_path: Where to save generated HTML
+            writers: Dict mapping placeholder names to callables that write
+                     the substituted value (UTF-8) into the open output file
+            title_tag: Template's default <title> element
+            title: Page title (replaces title_tag if provided)
+
+        Returns:
+            Tuple of (path to generated HTML file, bytes written)
+        """
+        parts = self._load_template(template_path)
 
-        # Update title if provided
         if title:
-            html = html.replace('<title>Terra Point Cloud Viewer (PLY)</title>',
-                              f'<title>{self._escape_html(title)}</title>')
+            old_title_tag = title_tag.encode('utf-8')
+            new_title_tag = f'<title>{self._escape_html(title)}</title>'.encode('utf-8')
 
-        # Write output
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html)
-
-        return output_path
+        with open(output_path, 'wb', buffering=HTML_WRITE_BUFFER_SIZE) as f:
+            for i, part in enumerate(parts):
+                if i % 2 == 0:
+                    # Literal template text (already UTF-8 encoded)
+                    if title:
+                        part = part.replace(old_title_tag, new_title_tag)
+                    f.write(part)
+                elif part in writers:
+                    writers[part](f)
+                else:
+                    # Unknown placeholder - leave untouched
+                    f.write(f'{{{{{part}}}}}'.encode('ascii'))
+
+            if hasattr(os, 'posix_fadvise'):
+                # Generate-and-forget output: start writeback and let the
+                # kernel drop it from the page cache instead of evicting
+                # more useful pages
+                f.flush()
+                _fadvise(f, os.POSIX_FADV_DONTNEED)
+
+            # Output size without a stat() after close
+            output_size = f.tell()
+
+        return output_path, output_size
 
     def _escape_js_string(self, text: str) -> str:
         """
@@ -147,16 +249,54 @@ class HTMLGenerator:
         Returns:
             Escaped string safe for JavaScript template literals
         """
-        # Escape backslashes first (must be first to avoid double-escaping)
-        text = text.replace('\\', '\\\\')
+        # Fast path: OBJ/PLY data almost never contains any of these, and a
+        # C-level substring scan is much cheaper than running the regex
+        if '\\' not in text and '`' not in text and '${' not in text:
+            return text
+
+        return self._JS_ESCAPE_RE.sub(lambda m: self._JS_ESCAPE_MAP[m.group(0)], text)
+
+    def _write_js_string(self, f: BinaryIO, text: str):
+        """
+        Escape string for a JavaScript template literal and write it to f.
 
-        # Escape backticks
-        text = text.replace('`', '\\`')
+        Escapes in fixed-size chunks so the escaped copy of a multi-MB
+        payload is never materialised in full.
 
-        # Escape ${ (template literal interpolation)
-        text = text.replace('${', '\\${')
+        Args:
+            f: Open output file
+            text: String to escape and write
+        """
+        chunk_size = self._JS_ESCAPE_CHUNK_SIZE
+        length = len(text)
+        start = 0
+
+        while start < length:
+            end = min(start + chunk_size, length)
+            # Don't split a '${' sequence across two chunks
+            while end < length and text[end - 1] == '$':
+                end += 1
+            f.write(self._escape_js_string(text[start:end]).encode('utf-8'))
+            start = end
+
+    def _write_json(self, f: BinaryIO, data: Dict):
+        """
+        Write data as compact JSON (UTF-8) to f.
 
-        return text
+        Uses orjson when installed (C encoder, emits UTF-8 bytes directly),
+        otherwise the stdlib encoder incrementally.
+
+        Args:
+            f: Open output file
+            data: JSON-serialisable object
+        """
+        if orjson is not None:
+            f.write(orjson.dumps(data))
+            return
+
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+        for chunk in encoder.iterencode(data):
+            f.write(chunk.encode('utf-8'))
 
     def _escape_html(self, text: str) -> str:
         """
@@ -168,12 +308,7 @@ class HTMLGenerator:
         Returns:
             HTML-safe string
         """
-        return (text
-                .replace('&', '&amp;')
-                .replace('<', '&lt;')
-                .replace('>', '&gt;')
-                .replace('"', '&quot;')
-                .replace("'", '&#x27;'))
+        return text.translate(self._HTML_ESCAPE_TABLE)
 
     def get_template_info(self, template_name: str) -> Dict:
         """
@@ -202,12 +337,9 @@ class HTMLGenerator:
 
     def _find_placeholders(self, template_path: Path) -> list:
         """Find all {{PLACEHOLDER}} markers in template."""
-        with open(template_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Find all {{PLACEHOLDER}} patterns
-        placeholders = re.findall(r'\{\{([A-Z_]+)\}\}', content)
-        return list(set(placeholders))  # Remove duplicates
+        # Placeholder names sit at the odd indices of the parsed template
+        placeholders = self._load_template(template_path)[1::2]
+        return list(dict.fromkeys(placeholders))  # Remove duplicates, keep order
 
     @staticmethod
     def format_file_size(bytes: int) -> str:
@@ -254,9 +386,13 @@ class HTMLGenerator:
         }
 
 
+# Shared instances returned by HTMLGenerator.default(), keyed by class
+_default_generators: Dict[type, HTMLGenerator] = {}
+
+
 # Example usage
 if __name__ == "__main__":
-    generator = HTMLGenerator()
+    generator = HTMLGenerator.default()
 
     # Check template info
     obj_info = generator.get_template_info('obj')
@@ -14,15 +14,62 @@ Supports standard MTL properties:
 """
 
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
+import io
 import re
+import sys
+
+
+# Texture path -> (material, attribute) pairs referencing it
+_TextureIndex = Dict[str, Set[Tuple['Material', str]]]
+
+
+def _texture_map(attr: str) -> property:
+    """Texture map attribute that keeps its material's texture index current."""
+    slot = '_' + attr
+
+    def getter(self):
+        return getattr(self, slot)
+
+    def setter(self, value):
+        index = self._texture_index
+        if index is not None:
+            old = getattr(self, slot)
+            refs = index.get(old)
+            if refs:
+                refs.discard((self, attr))
+                if not refs:
+                    del index[old]
+            if value:
+                index.setdefault(value, set()).add((self, attr))
+        setattr(self, slot, value)
+
+    return property(getter, setter)
 
 
 class Material:
     """Represents a single material from MTL file."""
 
+    __slots__ = ('name', 'ambient', 'diffuse', 'specular', 'shininess', 'opacity',
+                 'transparency', 'optical_density', 'illumination',
+                 '_map_diffuse', '_map_ambient', '_map_specular', '_map_shininess',
+                 '_map_bump', '_map_displacement', '_map_alpha', '_texture_index')
+
+    # Attributes holding texture map paths
+    _TEXTURE_ATTRS = ('map_diffuse', 'map_ambient', 'map_specular',
+                      'map_shininess', 'map_bump', 'map_displacement', 'map_alpha')
+
+    # Texture maps
+    map_diffuse = _texture_map('map_diffuse')  # map_Kd
+    map_ambient = _texture_map('map_ambient')  # map_Ka
+    map_specular = _texture_map('map_specular')  # map_Ks
+    map_shininess = _texture_map('map_shininess')  # map_Ns
+    map_bump = _texture_map('map_bump')  # map_Bump or bump
+    map_displacement = _texture_map('map_displacement')  # disp
+    map_alpha = _texture_map('map_alpha')  # map_d
+
     def __init__(self, name: str):
-        self.name = name
+        self.name = sys.intern(name)
         self.ambient = None  # Ka - ambient color (r, g, b)
         self.diffuse = None  # Kd - diffuse color (r, g, b)
         self.specular = None  # Ks - specular color (r, g, b)
@@ -32,37 +79,89 @@ class Material:
         self.optical_density = None  # Ni - optical density
         self.illumination = None  # illum - illumination model
 
-        # Texture maps
-        self.map_diffuse = None  # map_Kd
-        self.map_ambient = None  # map_Ka
-        self.map_specular = None  # map_Ks
-        self.map_shininess = None  # map_Ns
-        self.map_bump = None  # map_Bump or bump
-        self.map_displacement = None  # disp
-        self.map_alpha = None  # map_d
+        # Texture maps (set through the properties above once created)
+        self._map_diffuse = None
+        self._map_ambient = None
+        self._map_specular = None
+        self._map_shininess = None
+        self._map_bump = None
+        self._map_displacement = None
+        self._map_alpha = None
+
+        # Index of the parser this material belongs to, see _set_texture_index
+        self._texture_index: Optional[_TextureIndex] = None
+
+    def _set_texture_index(self, index: _TextureIndex):
+        """Record this material's texture maps in index and keep it updated."""
+        self._texture_index = index
+        for attr in self._TEXTURE_ATTRS:
+            value = getattr(self, attr)
+            if value:
+                index.setdefault(value, set()).add((self, attr))
 
     def get_texture_paths(self) -> Set[str]:
         """Get all texture file paths referenced by this material."""
-        textures = set()
-        for attr in ['map_diffuse', 'map_ambient', 'map_specular',
-                     'map_shininess', 'map_bump', 'map_displacement', 'map_alpha']:
-            value = getattr(self, attr)
-            if value:
-                textures.add(value)
-        return textures
+        return {value for attr in self._TEXTURE_ATTRS if (value := getattr(self, attr))}
 
     def __repr__(self):
-        textures = ', '.join(self.get_texture_paths()) if self.get_texture_paths() else 'none'
+        texture_paths = self.get_texture_paths()
+        textures = ', '.join(texture_paths) if texture_paths else 'none'
         return f"Material('{self.name}', textures=[{textures}])"
 
 
 class MTLParser:
     """Parser for Wavefront MTL material library files."""
 
+    # Keyword written by to_mtl_string for each texture map attribute
+    _TEXTURE_KEYWORDS = (
+        ('map_Kd ', 'map_diffuse'),
+        ('map_Ka ', 'map_ambient'),
+        ('map_Ks ', 'map_specular'),
+        ('map_Ns ', 'map_shininess'),
+        ('map_Bump ', 'map_bump'),
+        ('disp ', 'map_displacement'),
+        ('map_d ', 'map_alpha'),
+    )
+
     def __init__(self):
         self.materials: Dict[str, Material] = {}
         self.mtl_path: Optional[Path] = None
 
+        # Texture path -> (material, attribute) pairs referencing it, so
+        # update_texture_paths only visits affected maps. Materials keep it
+        # current as their texture maps are set (see _texture_map).
+        self._texture_index: _TextureIndex = {}
+
+        # Command -> (Material attribute, value parser). Keys use the
+        # spelling found in exported files; other spellings are looked up
+        # again in lower case. 'newmtl' maps to (None, None).
+        properties = {
+            'newmtl': (None, None),
+            'Ka': ('ambient', self._parse_color),  # Ambient color
+            'Kd': ('diffuse', self._parse_color),  # Diffuse color
+            'Ks': ('specular', self._parse_color),  # Specular color
+            'Ns': ('shininess', float),  # Shininess
+            'd': ('opacity', float),  # Opacity
+            'Tr': ('transparency', float),  # Transparency
+            'Ni': ('optical_density', float),  # Optical density
+            'illum': ('illumination', int),  # Illumination model
+            'map_Kd': ('map_diffuse', self._parse_texture_path),  # Diffuse texture
+            'map_Ka': ('map_ambient', self._parse_texture_path),  # Ambient texture
+            'map_Ks': ('map_specular', self._parse_texture_path),  # Specular texture
+            'map_Ns': ('map_shininess', self._parse_texture_path),  # Shininess texture
+            'map_Bump': ('map_bump', self._parse_texture_path),  # Bump map
+            'bump': ('map_bump', self._parse_texture_path),
+            'disp': ('map_displacement', self._parse_texture_path),  # Displacement map
+            'map_d': ('map_alpha', self._parse_texture_path),  # Alpha/transparency map
+        }
+        properties.update({key.lower(): value for key, value in properties.items()})
+        self._properties = properties
+
+        # First characters of all commands above (either case); any other
+        # line, including comments, is skipped without being split
+        self._command_chars = frozenset(
+            c for key in properties for c in (key[0], key[0].upper()))
+
     def parse_file(self, mtl_path: Path) -> Dict[str, Material]:
         """
         Parse MTL file and extract material definitions.
@@ -81,72 +180,56 @@ class MTLParser:
 
         self.mtl_path = mtl_path
         self.materials = {}
+        self._texture_index = texture_index = {}
         current_material = None
+        properties = self._properties
+        command_chars = self._command_chars
+
+        # Read the whole file at once; bytes.splitlines() splits on the same
+        # line endings as text mode
+        data = mtl_path.read_bytes()
 
-        with open(mtl_path, 'r', encoding='utf-8', errors='replace') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
+        for line_num, line in enumerate(data.splitlines(), 1):
+            line = line.decode('utf-8', 'replace').strip()
 
-                # Skip empty lines and comments
-                if not line or line.startswith('#'):
+            # Skip empty lines, comments and unknown commands
+            if not line or line[0] not in command_chars:
+                continue
+
+            # Parse line
+            parts = line.split(maxsplit=1)
+            command = parts[0]
+            args = parts[1] if len(parts) > 1 else ''
+
+            prop = properties.get(command)
+            if prop is None:
+                prop = properties.get(command.lower())
+                if prop is None:
                     continue
+            attr, parse = prop
+
+            # New material definition
+            if attr is None:
+                material_name = args.strip()
+                current_material = Material(material_name)
+                current_material._set_texture_index(texture_index)
+                self.materials[material_name] = current_material
+
+            elif current_material is None:
+                # Ignore commands before first newmtl
+                continue
 
-                # Parse line
+            # Material properties and texture maps
+            else:
+                # Only the value conversion can fail (float/int on bad input)
                 try:
-                    parts = line.split(maxsplit=1)
-                    if not parts:
-                        continue
-
-                    command = parts[0].lower()
-                    args = parts[1] if len(parts) > 1 else ''
-
-                    # New material definition
-                    if command == 'newmtl':
-                        material_name = args.strip()
-                        current_material = Material(material_name)
-                        self.materials[material_name] = current_material
-
-                    elif current_material is None:
-                        # Ignore commands before first newmtl
-                        continue
-
-                    # Material properties
-                    elif command == 'ka':  # Ambient color
-                        current_material.ambient = self._parse_color(args)
-                    elif command == 'kd':  # Diffuse color
-                        current_material.diffuse = self._parse_color(args)
-                    elif command == 'ks':  # Specular color
-                        current_material.specular = self._parse_color(args)
-                    elif command == 'ns':  # Shininess
-                        current_material.shininess = float(args)
-                    elif command == 'd':  # Opacity
-                        current_material.opacity = float(args)
-                    elif command == 'tr':  # Transparency
-                        current_material.transparency = float(args)
-                    elif command == 'ni':  # Optical density
-                        current_material.optical_density = float(args)
-                    elif command == 'illum':  # Illumination model
-                        current_material.illumination = int(args)
-
-                    # Texture maps
-                    elif command == 'map_kd':  # Diffuse texture
-                        current_material.map_diffuse = self._parse_texture_path(args)
-                    elif command == 'map_ka':  # Ambient texture
-                        current_material.map_ambient = self._parse_texture_path(args)
-                    elif command == 'map_ks':  # Specular texture
-                        current_material.map_specular = self._parse_texture_path(args)
-                    elif command == 'map_ns':  # Shininess texture
-                        current_material.map_shininess = self._parse_texture_path(args)
-                    elif command in {'map_bump', 'bump'}:  # Bump map
-                        current_material.map_bump = self._parse_texture_path(args)
-                    elif command == 'disp':  # Displacement map
-                        current_material.map_displacement = self._parse_texture_path(args)
-                    elif command == 'map_d':  # Alpha/transparency map
-                        current_material.map_alpha = self._parse_texture_path(args)
-
-                except (ValueError, IndexError) as e:
+                    value = parse(args)
+                except ValueError as e:
                     print(f"Warning: Error parsing MTL line {line_num}: {line}")
                     print(f"  Error: {e}")
+                    continue
+
+                setattr(current_material, attr, value)
 
         return self.materials
 
@@ -161,63 +244,46 @@ class MTLParser:
             Dict mapping material names to Material objects
         """
         self.materials = {}
+        self._texture_index = texture_index = {}
         current_material = None
+        properties = self._properties
+        command_chars = self._command_chars
 
         for line_num, line in enumerate(mtl_content.splitlines(), 1):
             line = line.strip()
 
-            if not line or line.startswith('#'):
+            if not line or line[0] not in command_chars:
                 continue
 
-            try:
-                parts = line.split(maxsplit=1)
-                if not parts:
+            parts = line.split(maxsplit=1)
+            command = parts[0]
+            args = parts[1] if len(parts) > 1 else ''
+
+            prop = properties.get(command)
+            if prop is None:
+                prop = properties.get(command.lower())
+                if prop is None:
                     continue
+            attr, parse = prop
 
-                command = parts[0].lower()
-                args = parts[1] if len(parts) > 1 else ''
+            if attr is None:
+                material_name = args.strip()
+                current_material = Material(material_name)
+                current_material._set_texture_index(texture_index)
+                self.materials[material_name] = current_material
 
-                if command == 'newmtl':
-                    material_name = args.strip()
-                    current_material = Material(material_name)
-                    self.materials[material_name] = current_material
+            elif current_material is None:
+                continue
 
-                elif current_material is None:
+            else:
+                # Only the value conversion can fail (float/int on bad input)
+                try:
+                    value = parse(args)
+                except ValueError:
+                    print(f"Warning: Error parsing MTL line {line_num}: {line}")
                     continue
 
-                elif command == 'ka':
-                    current_material.ambient = self._parse_color(args)
-                elif command == 'kd':
-                    current_material.diffuse = self._parse_color(args)
-                elif command == 'ks':
-                    current_material.specular = self._parse_color(args)
-                elif command == 'ns':
-                    current_material.shininess = float(args)
-                elif command == 'd':
-                    current_material.opacity = float(args)
-                elif command == 'tr':
-                    current_material.transparency = float(args)
-                elif command == 'ni':
-                    current_material.optical_density = float(args)
-                elif command == 'illum':
-                    current_material.illumination = int(args)
-                elif command == 'map_kd':
-                    current_material.map_diffuse = self._parse_texture_path(args)
-                elif command == 'map_ka':
-                    current_material.map_ambient = self._parse_texture_path(args)
-                elif command == 'map_ks':
-                    current_material.map_specular = self._parse_texture_path(args)
-                elif command == 'map_ns':
-                    current_material.map_shininess = self._parse_texture_path(args)
-                elif command in {'map_bump', 'bump'}:
-                    current_material.map_bump = self._parse_texture_path(args)
-                elif command == 'disp':
-                    current_material.map_displacement = self._parse_texture_path(args)
-                elif command == 'map_d':
-                    current_material.map_alpha = self._parse_texture_path(args)
-
-            except (ValueError, IndexError) as e:
-                print(f"Warning: Error parsing MTL line {line_num}: {line}")
+                setattr(current_material, attr, value)
 
         return self.materials
 
@@ -232,15 +298,36 @@ class MTLParser:
         """
         Update texture paths in materials (e.g., replace with data URIs).
 
+        Only the texture maps referencing a mapped path are visited, using
+        the texture index. Materials edited after parsing keep the index
+        current themselves; ones added to self.materials in code are added
+        to it here.
+
         Args:
             path_mapping: Dict mapping original paths to new paths/URIs
         """
+        index = self._texture_index
+
+        present = set()
         for material in self.materials.values():
-            for attr in ['map_diffuse', 'map_ambient', 'map_specular',
-                         'map_shininess', 'map_bump', 'map_displacement', 'map_alpha']:
-                value = getattr(material, attr)
-                if value and value in path_mapping:
-                    setattr(material, attr, path_mapping[value])
+            present.add(id(material))
+            if material._texture_index is not index:
+                material._set_texture_index(index)
+
+        # Take all affected references out first, so chained mappings
+        # (a -> b, b -> c) are applied only once per texture map. References
+        # from materials since removed from self.materials, or whose map has
+        # changed while indexed elsewhere, are dropped.
+        updates = []
+        for path in path_mapping.keys() & index.keys():
+            refs = [(material, attr) for material, attr in index.pop(path)
+                    if id(material) in present and getattr(material, attr) == path]
+            updates.append((path_mapping[path], refs))
+
+        # Setting the attribute files the reference under the new path
+        for new_path, refs in updates:
+            for material, attr in refs:
+                setattr(material, attr, new_path)
 
     def to_mtl_string(self) -> str:
         """
@@ -249,50 +336,46 @@ class MTLParser:
         Returns:
             MTL file content as string
         """
-        lines = []
+        out = io.StringIO()
+        write = out.write
 
-        for material in self.materials.values():
-            lines.append(f"newmtl {material.name}")
+        for i, material in enumerate(self.materials.values()):
+            if i:
+                write("\n")  # Empty line between materials
+            write(f"newmtl {material.name}\n")
 
             if material.ambient:
-                lines.append(f"Ka {' '.join(map(str, material.ambient))}")
+                write(f"Ka {' '.join(map(str, material.ambient))}\n")
             if material.diffuse:
-                lines.append(f"Kd {' '.join(map(str, material.diffuse))}")
+                write(f"Kd {' '.join(map(str, material.diffuse))}\n")
             if material.specular:
-                lines.append(f"Ks {' '.join(map(str, material.specular))}")
+                write(f"Ks {' '.join(map(str, material.specular))}\n")
             if material.shininess is not None:
-                lines.append(f"Ns {material.shininess}")
+                write(f"Ns {material.shininess}\n")
             if material.opacity != 1.0:
-                lines.append(f"d {material.opacity}")
+                write(f"d {material.opacity}\n")
             if material.transparency != 0.0:
-                lines.append(f"Tr {material.transparency}")
+                write(f"Tr {material.transparency}\n")
             if material.optical_density is not None:
-                lines.append(f"Ni {material.optical_density}")
+                write(f"Ni {material.optical_density}\n")
             if material.illumination is not None:
-                lines.append(f"illum {material.illumination}")
-
-            if material.map_diffuse:
-                lines.append(f"map_Kd {material.map_diffuse}")
-            if material.map_ambient:
-                lines.append(f"map_Ka {material.map_ambient}")
-            if material.map_specular:
-                lines.append(f"map_Ks {material.map_specular}")
-            if material.map_shininess:
-                lines.append(f"map_Ns {material.map_shininess}")
-            if material.map_bump:
-                lines.append(f"map_Bump {material.map_bump}")
-            if material.map_displacement:
-                lines.append(f"disp {material.map_displacement}")
-            if material.map_alpha:
-                lines.append(f"map_d {material.map_alpha}")
-
-            lines.append("")  # Empty line between materials
-
-        return '\n'.join(lines)
+                write(f"illum {material.illumination}\n")
+
+            # Texture maps may be data URIs of several MB, so they are
+            # written as is instead of being copied into an f-string
+            for keyword, attr in self._TEXTURE_KEYWORDS:
+                value = getattr(material, attr)
+                if value:
+                    write(keyword)
+                    write(value)
+                    write("\n")
+
+        return out.getvalue()
 
     def _parse_color(self, args: str) -> tuple:
         """Parse RGB color values (0.0-1.0)."""
-        values = args.split()
+        # Only the first three values are used, so stop splitting after them
+        values = args.split(None, 3)
         if len(values) >= 3:
             return (float(values[0]), float(values[1]), float(values[2]))
         return (0.0, 0.0, 0.0)
@@ -300,14 +383,22 @@ class MTLParser:
     def _parse_texture_path(self, args: str) -> str:
         """Parse texture map path, handling options like -blendu, -blendv."""
         # Texture maps can have options like: -blendu on -blendv on texture.jpg
-        # We want to extract just the filename
+        # We want to extract just the filename, which is normally the last
+        # token, so split off only that one
+        last = args.rsplit(None, 1)[-1:]
+        if last and not last[0].startswith('-'):
+            # Normalize path separators. str.replace returns the string
+            # itself when there is no backslash, so POSIX paths aren't copied.
+            # Interned, as one atlas texture is often shared by every material.
+            return sys.intern(last[0].replace('\\', '/'))
+
         parts = args.split()
 
         # Skip option flags (start with -)
         for part in reversed(parts):
             if not part.startswith('-'):
                 # Extract just the filename, normalize path separators
-                return part.replace('\\', '/')
+                return sys.intern(part.replace('\\', '/'))
 
         return args.strip()
 
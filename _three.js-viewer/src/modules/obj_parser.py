@@ -13,16 +13,47 @@ Wavefront OBJ format elements supported:
 - o  - Object names
 - usemtl - Material references
 - mtllib - Material library references
+
+Lines ending with a backslash are continued on the next line.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Set
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 import re
 
 
 class OBJParser:
     """Parser for Wavefront OBJ geometry files with multi-file support."""
 
+    # Files are tokenized as raw bytes and only decoded once at the end, so
+    # the tables below are keyed on bytes.
+
+    # First characters (byte values) of the commands below; other lines are
+    # passed through without being split
+    _COMMAND_CHARS = frozenset(b'vfgomuVFGOMU')
+
+    # Byte values removed by bytes.strip()
+    _WHITESPACE = frozenset(b' \t\n\r\x0b\x0c')
+
+    # Commands handled by the parse loops (OBJ keywords are lower-case in
+    # practice, anything else is looked up again after .lower())
+    _COMMANDS = frozenset({b'v', b'vt', b'vn', b'f', b'g', b'o', b'mtllib', b'usemtl'})
+
+    # Statistics counter for each counted command
+    _STAT_KEYS = {
+        b'v': 'vertices',
+        b'vn': 'normals',
+        b'vt': 'texcoords',
+        b'f': 'faces',
+        b'g': 'groups',
+        b'o': 'objects'
+    }
+
+    # Directory listings: (directory, pattern) -> (st_mtime_ns, paths), see
+    # _glob_cached. Adding or removing a file updates the directory mtime.
+    _glob_cache: Dict[Tuple[Path, str], Tuple[int, List[Path]]] = {}
+
     def __init__(self):
         self.obj_content: List[str] = []
         self.mtl_references: Set[str] = set()
@@ -53,13 +84,14 @@ class OBJParser:
         if not obj_path.exists():
             raise FileNotFoundError(f"OBJ file not found: {obj_path}")
 
-        with open(obj_path, 'r', encoding='utf-8', errors='replace') as f:
-            content = f.read()
+        # One read() of the whole file instead of buffered line iteration
+        data = obj_path.read_bytes()
 
-        self._analyze_obj_content(content)
+        self._analyze_obj_content(data)
         self.stats['files_merged'] = 1
 
-        return content
+        # Same newline translation as reading in text mode
+        return data.replace(b'\r\n', b'\n').replace(b'\r', b'\n').decode('utf-8', 'replace')
 
     def parse_files(self, obj_paths: List[Path]) -> str:
         """
@@ -80,172 +112,277 @@ class OBJParser:
         if not obj_paths:
             raise ValueError("No OBJ files provided")
 
-        merged_lines = []
+        out = bytearray()  # Merged content, one b'\n'-terminated line at a time
+        seen_mtllib = set()
+        stats = self.stats
+        command_chars = self._COMMAND_CHARS
+        commands = self._COMMANDS
         v_offset = 0  # Vertex offset
         vt_offset = 0  # Texture coord offset
         vn_offset = 0  # Normal offset
 
-        for i, obj_path in enumerate(obj_paths):
+        for obj_path in obj_paths:
             if not obj_path.exists():
                 raise FileNotFoundError(f"OBJ file not found: {obj_path}")
 
-            with open(obj_path, 'r', encoding='utf-8', errors='replace') as f:
-                lines = f.readlines()
+        # The next file is read in the background while this one is processed.
+        # Each file is taken with next() rather than zip(): zip and enumerate
+        # keep their last result tuple for reuse, which would hold on to the
+        # contents after `del data` below.
+        contents = self._read_ahead(obj_paths)
 
-            # Count vertices/normals/texcoords in current file for offset calculation
+        for i, obj_path in enumerate(obj_paths):
+            data = next(contents)
+
+            # Elements in current file; added to offsets once the file is done.
+            # Faces only reference elements of their own file, so the offsets
+            # from previous files are all that is needed while streaming.
             file_v_count = 0
             file_vt_count = 0
             file_vn_count = 0
+            face_cache: Dict[bytes, bytes] = {}  # Adjusted vertex refs for this file
 
-            # First pass: count elements
-            for line in lines:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-
-                parts = line.split(maxsplit=1)
-                if not parts:
-                    continue
+            header = f"# === File {i+1}: {obj_path.name} ===".encode('utf-8', 'replace')
+            header_needed = i > 0
 
-                command = parts[0].lower()
+            continued = b'\\' in data
+            lines = data.splitlines()
+            del data  # Last reference: frees the file contents before merging
+            if continued:
+                lines = self._join_continued_lines(lines)
 
-                if command == 'v':
-                    file_v_count += 1
-                elif command == 'vt':
-                    file_vt_count += 1
-                elif command == 'vn':
-                    file_vn_count += 1
-
-            # Second pass: process and add offset to face indices
+            # Single pass: copy lines, adjust face indices and update stats
             for line in lines:
                 line = line.strip()
 
-                # Skip empty lines and comments (but keep them for readability)
+                # Keep empty lines for readability
                 if not line:
-                    merged_lines.append('')
+                    out += b'\n'
                     continue
-                if line.startswith('#'):
-                    merged_lines.append(line)
+                # Comments and untracked commands (s, l, ...) are copied as-is
+                if line[0] not in command_chars:
+                    out += line
+                    out += b'\n'
                     continue
 
-                parts = line.split(maxsplit=1)
-                if not parts:
-                    continue
-
-                command = parts[0].lower()
-                args = parts[1] if len(parts) > 1 else ''
+                parts = line.split(None, 1)
+                command = parts[0]
+                if command not in commands:
+                    command = command.lower()
+                args = parts[1] if len(parts) > 1 else b''
 
-                # Add comment separator between files
-                if i > 0 and command in {'v', 'o', 'g'} and len(merged_lines) > 0 and merged_lines[-1]:
-                    if merged_lines[-1] != f"# === File {i+1}: {obj_path.name} ===":
-                        merged_lines.append(f"# === File {i+1}: {obj_path.name} ===")
+                # Add comment separator between files, once, before the first
+                # vertex/object/group of each file after the first
+                if header_needed and command in {b'v', b'o', b'g'}:
+                    out += header
+                    out += b'\n'
+                    header_needed = False
 
                 # Pass through geometric data unchanged
-                if command in {'v', 'vt', 'vn'}:
-                    merged_lines.append(line)
+                if command == b'v':
+                    file_v_count += 1
+                    out += line
+                    out += b'\n'
+                elif command == b'vt':
+                    file_vt_count += 1
+                    out += line
+                    out += b'\n'
+                elif command == b'vn':
+                    file_vn_count += 1
+                    out += line
+                    out += b'\n'
 
                 # Adjust face indices by offsets
-                elif command == 'f':
+                elif command == b'f':
+                    stats['faces'] += 1
                     adjusted_face = self._adjust_face_indices(
-                        args, v_offset, vt_offset, vn_offset
+                        args, v_offset, vt_offset, vn_offset, face_cache
                     )
-                    merged_lines.append(f"f {adjusted_face}")
+                    out += b'f '
+                    out += adjusted_face
+                    out += b'\n'
 
                 # Track material library references
-                elif command == 'mtllib':
-                    self.mtl_references.add(args.strip())
+                elif command == b'mtllib':
+                    self.mtl_references.add(args.strip().decode('utf-8', 'replace'))
                     # Only add mtllib once (avoid duplicates)
-                    if f"mtllib {args}" not in merged_lines:
-                        merged_lines.append(line)
+                    if b'mtllib ' + args not in seen_mtllib:
+                        seen_mtllib.add(line)
+                        out += line
+                        out += b'\n'
 
                 # Track material usage
-                elif command == 'usemtl':
-                    self.material_usage.add(args.strip())
-                    merged_lines.append(line)
+                elif command == b'usemtl':
+                    self.material_usage.add(args.strip().decode('utf-8', 'replace'))
+                    out += line
+                    out += b'\n'
 
                 # Pass through other commands
                 else:
-                    merged_lines.append(line)
+                    if command == b'g':
+                        stats['groups'] += 1
+                    elif command == b'o':
+                        stats['objects'] += 1
+                    out += line
+                    out += b'\n'
 
             # Update offsets for next file
             v_offset += file_v_count
             vt_offset += file_vt_count
             vn_offset += file_vn_count
 
-        merged_content = '\n'.join(merged_lines)
-        self._analyze_obj_content(merged_content)
-        self.stats['files_merged'] = len(obj_paths)
+        stats['vertices'] += v_offset
+        stats['texcoords'] += vt_offset
+        stats['normals'] += vn_offset
+        stats['files_merged'] = len(obj_paths)
 
-        return merged_content
+        # Lines are joined by b'\n', without a trailing one
+        if out:
+            del out[-1]
+        return out.decode('utf-8', 'replace')
 
-    def _adjust_face_indices(self, face_def: str,
-                             v_offset: int, vt_offset: int, vn_offset: int) -> str:
+    def _adjust_face_indices(self, face_def: bytes,
+                             v_offset: int, vt_offset: int, vn_offset: int,
+                             cache: Optional[Dict[bytes, bytes]] = None) -> bytes:
         """
         Adjust face vertex indices by offsets.
 
         Face format: v/vt/vn or v//vn or v/vt or v
-        Example: "1/1/1 2/2/2 3/3/3" with offset 10 becomes "11/11/11 12/12/12 13/13/13"
+        Example: b"1/1/1 2/2/2 3/3/3" with offset 10 becomes b"11/11/11 12/12/12 13/13/13"
 
         Args:
-            face_def: Face definition string (e.g., "1/1/1 2/2/2 3/3/3")
+            face_def: Face definition bytes (e.g., b"1/1/1 2/2/2 3/3/3")
             v_offset: Vertex index offset
             vt_offset: Texture coordinate offset
             vn_offset: Normal index offset
+            cache: Optional dict of already adjusted vertex references. Only
+                valid for one set of offsets; a mesh vertex is typically
+                shared by several faces, so reusing it skips the int/str
+                round-trips for repeated references.
 
         Returns:
-            Adjusted face definition string
+            Adjusted face definition bytes
         """
-        vertices = face_def.split()
+        if cache is None:
+            cache = {}
         adjusted_vertices = []
 
-        for vertex in vertices:
-            parts = vertex.split('/')
+        for vertex in face_def.split():
+            adjusted = cache.get(vertex)
+            if adjusted is None:
+                parts = vertex.split(b'/')
 
-            # Adjust vertex index (always present)
-            if parts[0]:
-                parts[0] = str(int(parts[0]) + v_offset)
+                # Adjust vertex index (always present)
+                if parts[0]:
+                    parts[0] = b'%d' % (int(parts[0]) + v_offset)
 
-            # Adjust texture coordinate index (if present)
-            if len(parts) > 1 and parts[1]:
-                parts[1] = str(int(parts[1]) + vt_offset)
+                # Adjust texture coordinate index (if present)
+                if len(parts) > 1 and parts[1]:
+                    parts[1] = b'%d' % (int(parts[1]) + vt_offset)
 
-            # Adjust normal index (if present)
-            if len(parts) > 2 and parts[2]:
-                parts[2] = str(int(parts[2]) + vn_offset)
+                # Adjust normal index (if present)
+                if len(parts) > 2 and parts[2]:
+                    parts[2] = b'%d' % (int(parts[2]) + vn_offset)
 
-            adjusted_vertices.append('/'.join(parts))
+                adjusted = cache[vertex] = b'/'.join(parts)
 
-        return ' '.join(adjusted_vertices)
+            adjusted_vertices.append(adjusted)
 
-    def _analyze_obj_content(self, content: str):
-        """Analyze OBJ content and update statistics."""
-        for line in content.splitlines():
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
+        return b' '.join(adjusted_vertices)
+
+    @staticmethod
+    def _read_ahead(paths: List[Path]) -> Iterator[bytes]:
+        """
+        Read files in order, one file ahead in a background thread.
+
+        File reads release the GIL, so reading the next OBJ overlaps with
+        processing the current one. At most two files are held in memory.
 
-            parts = line.split(maxsplit=1)
-            if not parts:
+        Args:
+            paths: Files to read
+
+        Yields:
+            Contents of each file
+        """
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pending = [pool.submit(paths[0].read_bytes)]
+            for path in paths[1:]:
+                pending.append(pool.submit(path.read_bytes))
+                # Not kept in a local (or in the finished future), so the
+                # caller's reference is the only one
+                yield pending.pop(0).result()
+            yield pending.pop(0).result()
+
+    @staticmethod
+    def _join_continued_lines(lines: Iterable[bytes]) -> Iterator[bytes]:
+        """
+        Join lines ending with a backslash with the line that follows.
+
+        Lines are joined lazily while iterating, with a single space in
+        place of the backslash, so the file is never rebuilt in memory.
+        Lines without a continuation are yielded unchanged.
+
+        Args:
+            lines: Raw lines of an OBJ file
+
+        Yields:
+            Logical lines
+        """
+        carry = bytearray()
+        for line in lines:
+            stripped = line.strip()
+            if stripped.endswith(b'\\'):
+                carry += stripped[:-1]
+                carry += b' '
                 continue
+            if carry:
+                carry += stripped
+                line = bytes(carry)
+                carry.clear()
+            yield line
+
+        # Continuation on the last line of the file
+        if carry:
+            yield bytes(carry)
+
+    def _analyze_obj_content(self, content: bytes):
+        """Analyze raw OBJ content and update statistics."""
+        stats = self.stats
+        stat_keys = self._STAT_KEYS
+        command_chars = self._COMMAND_CHARS
+        commands = self._COMMANDS
+        whitespace = self._WHITESPACE
+
+        lines = content.splitlines()
+        if b'\\' in content:
+            lines = self._join_continued_lines(lines)
+
+        for line in lines:
+            # Look at the first byte before stripping anything: blank lines,
+            # comments and untracked commands are skipped without allocating,
+            # and only indented lines need lstrip(). split() below ignores
+            # any trailing whitespace.
+            if not line:
+                continue
+            if line[0] not in command_chars:
+                if line[0] not in whitespace:
+                    continue
+                line = line.lstrip()
+                if not line or line[0] not in command_chars:
+                    continue
 
-            command = parts[0].lower()
-
-            if command == 'v':
-                self.stats['vertices'] += 1
-            elif command == 'vn':
-                self.stats['normals'] += 1
-            elif command == 'vt':
-                self.stats['texcoords'] += 1
-            elif command == 'f':
-                self.stats['faces'] += 1
-            elif command == 'g':
-                self.stats['groups'] += 1
-            elif command == 'o':
-                self.stats['objects'] += 1
-            elif command == 'mtllib':
-                self.mtl_references.add(parts[1].strip() if len(parts) > 1 else '')
-            elif command == 'usemtl':
-                self.material_usage.add(parts[1].strip() if len(parts) > 1 else '')
+            parts = line.split(None, 1)
+            command = parts[0]
+            if command not in commands:
+                command = command.lower()
+
+            key = stat_keys.get(command)
+            if key is not None:
+                stats[key] += 1
+            elif command == b'mtllib':
+                self.mtl_references.add(parts[1].strip().decode('utf-8', 'replace') if len(parts) > 1 else '')
+            elif command == b'usemtl':
+                self.material_usage.add(parts[1].strip().decode('utf-8', 'replace') if len(parts) > 1 else '')
 
     def get_mtl_references(self) -> Set[str]:
         """Get all MTL file references found in OBJ file(s)."""
@@ -259,6 +396,30 @@ class OBJParser:
         """Get parsing statistics."""
         return self.stats.copy()
 
+    @staticmethod
+    def _glob_cached(directory: Path, pattern: str) -> List[Path]:
+        """
+        Glob a directory, reusing the previous result while it is unchanged.
+
+        Args:
+            directory: Directory to search
+            pattern: Glob pattern (e.g. '*.mtl')
+
+        Returns:
+            Matching paths in glob order (empty if the directory doesn't exist)
+        """
+        try:
+            mtime_ns = directory.stat().st_mtime_ns
+        except OSError:
+            return []
+
+        key = (directory, pattern)
+        cached = OBJParser._glob_cache.get(key)
+        if cached is None or cached[0] != mtime_ns:
+            cached = (mtime_ns, list(directory.glob(pattern)))
+            OBJParser._glob_cache[key] = cached
+        return cached[1]
+
     @staticmethod
     def find_obj_files(directory: Path) -> List[Path]:
         """
@@ -270,10 +431,10 @@ class OBJParser:
         Returns:
             List of OBJ file paths, sorted alphabetically
         """
-        if not directory.exists() or not directory.is_dir():
+        if not directory.is_dir():
             return []
 
-        obj_files = sorted(directory.glob('*.obj'))
+        obj_files = sorted(OBJParser._glob_cached(directory, '*.obj'))
         return obj_files
 
     @staticmethod
@@ -285,19 +446,23 @@ class OBJParser:
         1. MTL file with same name as OBJ
         2. Any MTL file in same directory
 
+        The directory listing is cached, so looking up the MTL for several
+        OBJ files in one directory scans it only once.
+
         Args:
             obj_path: Path to OBJ file
 
         Returns:
             Path to MTL file, or None if not found
         """
+        mtl_files = OBJParser._glob_cached(obj_path.parent, '*.mtl')
+
         # Check for same-named MTL
         mtl_path = obj_path.with_suffix('.mtl')
-        if mtl_path.exists():
+        if mtl_path in mtl_files:
             return mtl_path
 
         # Check for any MTL in directory
-        mtl_files = list(obj_path.parent.glob('*.mtl'))
         if mtl_files:
             return mtl_files[0]
 
@@ -14,9 +14,55 @@ Supports:
 
 import base64
 import io
+import os
+import warnings
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import Optional, Tuple, Dict
-from PIL import Image
+from typing import BinaryIO, Optional, Tuple, Dict
+import PIL
+from PIL import ExifTags, Image, features
+
+try:
+    import pybase64  # Optional: SIMD Base64 encoder for large textures
+except ImportError:
+    pybase64 = None
+
+# Pillow-SIMD (a drop-in Pillow fork with vectorized resize kernels) tags its
+# releases with a .postN suffix; reported in verbose CLI output
+PILLOW_SIMD = '.post' in PIL.__version__
+
+# IJG standard luminance quantization table (quality 50, natural order),
+# used to estimate the quality a JPEG was saved at
+_JPEG_LUMA_TABLE = (
+    16, 11, 10, 16, 24, 40, 51, 61, 12, 12, 14, 19, 26, 58, 60, 55,
+    14, 13, 16, 24, 40, 57, 69, 56, 14, 17, 22, 29, 51, 87, 80, 62,
+    18, 22, 37, 56, 68, 109, 103, 77, 24, 35, 55, 64, 81, 104, 113, 92,
+    49, 64, 78, 87, 103, 121, 120, 101, 72, 92, 95, 98, 112, 100, 103, 99,
+)
+_JPEG_LUMA_TABLE_SUM = sum(_JPEG_LUMA_TABLE)
+
+
+def _scaled_luma_table(quality: int) -> Tuple[int, ...]:
+    """Luminance table libjpeg writes for a quality (1-100), baseline-clamped."""
+    scale = 5000 // quality if quality < 50 else 200 - 2 * quality
+    return tuple(min(max((value * scale + 50) // 100, 1), 255) for value in _JPEG_LUMA_TABLE)
+
+
+# Standard luminance table -> the quality it is written for
+_JPEG_LUMA_QUALITIES = {_scaled_luma_table(quality): quality for quality in range(1, 101)}
+
+# Modes Image.reduce() supports, so resize() can take a reducing_gap
+# ('1' and 'P' are always resized with nearest-neighbour, which skips it)
+_REDUCE_MODES = {'L', 'LA', 'La', 'PA', 'RGB', 'RGBA', 'RGBa', 'RGBX',
+                 'CMYK', 'YCbCr', 'LAB', 'HSV', 'I', 'F'}
+
+# Encoded image bytes per Base64 chunk when writing data URIs to a stream
+# (multiple of 3, so chunks concatenate without padding)
+BASE64_CHUNK_SIZE = 57 * 1024
+
+# Below this many bytes, pybase64's SIMD setup costs more than it saves and
+# the stdlib encoder is used (tiny thumbnails, palette PNGs)
+PYBASE64_MIN_SIZE = 512
 
 
 class TextureProcessor:
@@ -42,6 +88,9 @@ class TextureProcessor:
         self.jpeg_quality = jpeg_quality
         self.webp_quality = webp_quality
 
+        # Reused by _encode_image_to_data_uri for every texture
+        self._encode_buffer = io.BytesIO()
+
         self.stats = {
             'processed': 0,
             'total_original_size': 0,
@@ -50,16 +99,19 @@ class TextureProcessor:
             'converted_count': 0
         }
 
-    def process_texture(self, image_path: Path) -> Dict[str, any]:
+    def process_texture(self, image_path: Path,
+                        out_stream: Optional[BinaryIO] = None) -> Dict[str, any]:
         """
         Process a single texture file.
 
         Args:
             image_path: Path to image file
+            out_stream: Optional binary stream to write the data URI to
+                (ASCII, in chunks) instead of returning it as a string
 
         Returns:
             Dict with keys:
-                - 'data_uri': Base64 encoded data URI
+                - 'data_uri': Base64 encoded data URI (omitted with out_stream)
                 - 'original_size': Original file size in bytes
                 - 'encoded_size': Encoded data URI size in bytes
                 - 'format': Image format (jpeg, png, webp)
@@ -74,41 +126,38 @@ class TextureProcessor:
         if not image_path.exists():
             raise FileNotFoundError(f"Texture file not found: {image_path}")
 
-        if image_path.suffix.lower() not in self.SUPPORTED_FORMATS:
+        suffix = image_path.suffix.lower()
+        if suffix not in self.SUPPORTED_FORMATS:
             raise ValueError(f"Unsupported image format: {image_path.suffix}")
 
-        # Track original size
-        original_size = image_path.stat().st_size
-        self.stats['total_original_size'] += original_size
-
         # Open image
         img = Image.open(image_path)
+
+        # Track original size, from the file Pillow already has open
+        # (fstat on the descriptor, not another path lookup)
+        original_size = os.fstat(img.fp.fileno()).st_size
+        self.stats['total_original_size'] += original_size
+
         original_dimensions = img.size
         downscaled = False
-        converted = False
-
-        # Downscale if needed
-        if self.max_resolution and max(img.size) > self.max_resolution:
-            img = self._downscale_image(img, self.max_resolution)
-            downscaled = True
-            self.stats['downscaled_count'] += 1
 
         # Determine output format
+        converted = False
         if self.convert_to_webp:
             output_format = 'webp'
             mime_type = 'image/webp'
             quality = self.webp_quality
             converted = True
             self.stats['converted_count'] += 1
-        elif image_path.suffix.lower() in {'.jpg', '.jpeg'}:
+        elif suffix in {'.jpg', '.jpeg'}:
             output_format = 'jpeg'
             mime_type = 'image/jpeg'
             quality = self.jpeg_quality
-        elif image_path.suffix.lower() == '.png':
+        elif suffix == '.png':
             output_format = 'png'
             mime_type = 'image/png'
             quality = None  # PNG doesn't use quality parameter
-        elif image_path.suffix.lower() == '.webp':
+        elif suffix == '.webp':
             output_format = 'webp'
             mime_type = 'image/webp'
             quality = self.webp_quality
@@ -119,13 +168,51 @@ class TextureProcessor:
             quality = self.jpeg_quality
             converted = True
 
+        # Downscale if needed
+        if self.max_resolution and max(img.size) > self.max_resolution:
+            # Let libjpeg decode JPEGs at 1/2, 1/4 or 1/8 scale (no larger
+            # than needed for the target size), so Lanczos has fewer pixels
+            # to filter. No-op for other formats.
+            if img.format == 'JPEG':
+                img.draft(img.mode, self._scaled_size(*img.size, self.max_resolution))
+            # Alpha textures going to JPEG/WebP are flattened onto white
+            # before resizing: an RGB resize skips the alpha premultiply and
+            # unpremultiply passes, which outweighs compositing more pixels.
+            # (Palette images are resized as is, with nearest-neighbour.)
+            if output_format in {'jpeg', 'webp'} and img.mode in {'RGBA', 'LA'}:
+                img = self._composite_on_white(img)
+            img = self._downscale_image(img, self.max_resolution)
+            downscaled = True
+            self.stats['downscaled_count'] += 1
+
+        # JPEGs already at their output size are embedded as is, skipping
+        # decode and re-encode, unless saved at a higher quality than
+        # jpeg_quality (re-encoding then makes them smaller). Checked against
+        # the decoded format, as the suffix may not match the contents. PNGs
+        # are always re-encoded, since optimize=True usually shrinks them.
+        # Re-encoding drops EXIF, so rotated photos (orientation other than
+        # 1) are re-encoded too, to display the same as other textures.
+        passthrough = (not downscaled and not converted and
+                       output_format == 'jpeg' and img.format == 'JPEG' and
+                       _estimate_jpeg_quality(img) <= self.jpeg_quality and
+                       img.getexif().get(ExifTags.Base.Orientation, 1) == 1)
+
+        if passthrough:
+            buffer = self._read_file(image_path)
+        else:
+            buffer = self._save_image(img, output_format, quality)
+
         # Encode to Base64
-        data_uri = self._encode_image_to_data_uri(img, output_format, mime_type, quality)
-        encoded_size = len(data_uri)
+        if out_stream is None:
+            data_uri = self._buffer_to_data_uri(buffer, mime_type)
+            encoded_size = len(data_uri)
+        else:
+            data_uri = None
+            encoded_size = self._write_buffer_data_uri(buffer, mime_type, out_stream)
         self.stats['total_encoded_size'] += encoded_size
         self.stats['processed'] += 1
 
-        return {
+        result = {
             'data_uri': data_uri,
             'original_size': original_size,
             'encoded_size': encoded_size,
@@ -135,26 +222,117 @@ class TextureProcessor:
             'converted': converted,
             'original_dimensions': original_dimensions
         }
+        if out_stream is not None:
+            # Already written to out_stream
+            del result['data_uri']
 
-    def process_textures_batch(self, image_paths: list[Path]) -> Dict[str, Dict]:
+        return result
+
+    def process_textures_batch(self, image_paths: list[Path],
+                               use_threads: bool = False,
+                               raise_errors: bool = False,
+                               executor: Optional[Executor] = None) -> Dict[str, Dict]:
         """
         Process multiple texture files.
 
+        Textures are independent and CPU-bound, so larger batches are spread
+        over worker processes (PIL's Python glue holds the GIL). Results and
+        warnings still come out in input order.
+
+        With use_threads, worker threads are used instead. Decoding, resizing
+        and JPEG/WebP encoding release the GIL, so the stages of different
+        textures still overlap, without process start-up or pickling each
+        data URI back. Suits environments where spawning is slow or
+        unavailable (e.g. frozen executables, restricted hosts).
+
+        Args:
+            image_paths: List of paths to image files
+            use_threads: Use worker threads instead of worker processes
+            raise_errors: Raise the first failure (in input order) instead of
+                recording {'error': ...} for the texture and continuing
+            executor: Existing pool to run textures on, e.g. one shared by
+                several concurrent runs (left running; use_threads ignored)
+
+        Returns:
+            Dict mapping filename to processing results
+
+        Raises:
+            Exception: With raise_errors, whatever processing a texture raised
+        """
+        # Checked here, in the calling process: pool workers only run
+        # process_texture, so the warning isn't repeated once per worker
+        _check_jpeg_encoder()
+
+        results = {}
+
+        if executor is not None:
+            return self._run_batch(executor, image_paths, raise_errors)
+
+        # Too few textures aren't worth the worker start-up cost
+        if len(image_paths) <= 2:
+            for image_path in image_paths:
+                try:
+                    result = self.process_texture(image_path)
+                    results[image_path.name] = result
+                except Exception as e:
+                    if raise_errors:
+                        raise
+                    print(f"Warning: Failed to process {image_path.name}: {e}")
+                    results[image_path.name] = {'error': str(e)}
+
+            return results
+
+        # Imported here: pulls in multiprocessing, which single-texture and
+        # OBJ-only runs don't need
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        # Each worker task gets its own TextureProcessor (and encode buffer),
+        # so threads share no mutable state either
+        executor_class = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+
+        with executor_class(
+            max_workers=min(len(image_paths), os.cpu_count() or 1)
+        ) as executor:
+            return self._run_batch(executor, image_paths, raise_errors)
+
+    def _run_batch(self, executor: Executor, image_paths: list[Path],
+                   raise_errors: bool) -> Dict[str, Dict]:
+        """
+        Run textures on an executor, collecting results in input order.
+
         Args:
+            executor: Process or thread pool to submit to
             image_paths: List of paths to image files
+            raise_errors: Re-raise the first failure (see process_textures_batch)
 
         Returns:
             Dict mapping filename to processing results
         """
         results = {}
 
-        for image_path in image_paths:
+        futures = [
+            executor.submit(_process_one, image_path, self.max_resolution,
+                            self.convert_to_webp, self.jpeg_quality,
+                            self.webp_quality)
+            for image_path in image_paths
+        ]
+
+        for image_path, future in zip(image_paths, futures):
             try:
-                result = self.process_texture(image_path)
+                result, worker_stats = future.result()
                 results[image_path.name] = result
             except Exception as e:
+                if raise_errors:
+                    # Don't start textures still waiting for a worker
+                    for pending in futures:
+                        pending.cancel()
+                    raise
                 print(f"Warning: Failed to process {image_path.name}: {e}")
                 results[image_path.name] = {'error': str(e)}
+                continue
+
+            for key, value in worker_stats.items():
+                self.stats[key] += value
 
         return results
 
@@ -170,20 +348,27 @@ class TextureProcessor:
             Downscaled PIL Image
         """
         width, height = img.size
-
-        if max(width, height) <= max_size:
+        if width <= max_size and height <= max_size:
             return img
 
-        # Calculate new dimensions maintaining aspect ratio
+        # Use high-quality Lanczos resampling. For large reductions,
+        # reducing_gap first box-reduces by an integer factor (cheap) so the
+        # Lanczos taps cover far fewer source pixels; 2.0 is what
+        # Image.thumbnail uses and is visually indistinguishable.
+        # Image.reduce() rejects some modes (e.g. 16-bit greyscale I;16),
+        # which are resized in one pass as before.
+        reducing_gap = 2.0 if img.mode in _REDUCE_MODES else None
+        return img.resize(self._scaled_size(width, height, max_size), Image.Resampling.LANCZOS,
+                          reducing_gap=reducing_gap)
+
+    @staticmethod
+    def _scaled_size(width: int, height: int, max_size: int) -> Tuple[int, int]:
+        """Dimensions fitting within max_size, maintaining aspect ratio."""
+        # Integer arithmetic: exact, where int(height * (max_size / width))
+        # could round a whole-number result down by one pixel
         if width > height:
-            new_width = max_size
-            new_height = int(height * (max_size / width))
-        else:
-            new_height = max_size
-            new_width = int(width * (max_size / height))
-
-        # Use high-quality Lanczos resampling
-        return img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            return max_size, height * max_size // width
+        return width * max_size // height, max_size
 
     def _encode_image_to_data_uri(self, img: Image.Image,
                                    format: str, mime_type: str,
@@ -200,16 +385,81 @@ class TextureProcessor:
         Returns:
             Base64 data URI string
         """
-        buffer = io.BytesIO()
+        return self._buffer_to_data_uri(self._save_image(img, format, quality), mime_type)
+
+    def _buffer_to_data_uri(self, buffer: io.BytesIO, mime_type: str) -> str:
+        """
+        Base64-encode an encoded image held in a buffer as a data URI.
+
+        Args:
+            buffer: Buffer holding the encoded image
+            mime_type: MIME type for data URI
+
+        Returns:
+            Base64 data URI string
+        """
+        # Encode to Base64 (pybase64 when installed: several times faster
+        # than the stdlib on multi-MB textures, same output). getbuffer()
+        # reads the encoded image in place instead of copying it out first.
+        with buffer.getbuffer() as image_data:
+            if pybase64 is not None and len(image_data) >= PYBASE64_MIN_SIZE:
+                base64_data = pybase64.b64encode_as_string(image_data)
+            else:
+                base64_data = base64.b64encode(image_data).decode('ascii')
+
+        return f"data:{mime_type};base64,{base64_data}"
+
+    def _write_buffer_data_uri(self, buffer: io.BytesIO, mime_type: str,
+                               out_stream: BinaryIO) -> int:
+        """
+        Write an encoded image held in a buffer to a binary stream as a
+        Base64 data URI.
+
+        The Base64 text is produced in BASE64_CHUNK_SIZE pieces, so no
+        copy of the whole data URI is held in memory.
+
+        Args:
+            buffer: Buffer holding the encoded image
+            mime_type: MIME type for data URI
+            out_stream: Binary stream to write to
+
+        Returns:
+            Number of bytes written
+        """
+        b64encode = pybase64.b64encode if pybase64 is not None else base64.b64encode
+
+        prefix = f"data:{mime_type};base64,".encode('ascii')
+        out_stream.write(prefix)
+        written = len(prefix)
+
+        with buffer.getbuffer() as image_data:
+            for start in range(0, len(image_data), BASE64_CHUNK_SIZE):
+                chunk = b64encode(image_data[start:start + BASE64_CHUNK_SIZE])
+                out_stream.write(chunk)
+                written += len(chunk)
+
+        return written
+
+    def _save_image(self, img: Image.Image, format: str,
+                    quality: Optional[int]) -> io.BytesIO:
+        """
+        Encode PIL Image into the reusable encode buffer.
+
+        Args:
+            img: PIL Image object
+            format: Output format (jpeg, png, webp)
+            quality: Compression quality (None for PNG)
+
+        Returns:
+            The encode buffer, holding the encoded image
+        """
+        buffer = self._encode_buffer
+        buffer.seek(0)
+        buffer.truncate()
 
         # Convert RGBA to RGB for JPEG/WebP if needed
         if format in {'jpeg', 'webp'} and img.mode in {'RGBA', 'LA', 'P'}:
-            # Create white background
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            if img.mode == 'P':
-                img = img.convert('RGBA')
-            background.paste(img, mask=img.split()[-1] if img.mode in {'RGBA', 'LA'} else None)
-            img = background
+            img = self._composite_on_white(img)
 
         # Save to buffer
         save_kwargs = {'format': format.upper()}
@@ -217,14 +467,51 @@ class TextureProcessor:
             save_kwargs['quality'] = quality
         if format == 'png':
             save_kwargs['optimize'] = True
+        elif format == 'webp':
+            # Lossy only; low qualities don't gain from libwebp's slower
+            # methods, so use a faster one (3-4x encode speed, default 4)
+            save_kwargs['lossless'] = False
+            save_kwargs['method'] = 2 if quality < 60 else 4
+        elif format == 'jpeg':
+            # Pillow's defaults, stated so they don't change under us: an
+            # extra Huffman/progressive pass costs encode time for a few %
+            save_kwargs['optimize'] = False
+            save_kwargs['progressive'] = False
 
         img.save(buffer, **save_kwargs)
 
-        # Encode to Base64
-        image_data = buffer.getvalue()
-        base64_data = base64.b64encode(image_data).decode('utf-8')
+        return buffer
 
-        return f"data:{mime_type};base64,{base64_data}"
+    def _read_file(self, image_path: Path) -> io.BytesIO:
+        """
+        Read an image file unchanged into the reusable encode buffer.
+
+        Args:
+            image_path: Path to image file
+
+        Returns:
+            The encode buffer, holding the file contents
+        """
+        buffer = self._encode_buffer
+        buffer.seek(0)
+        buffer.truncate()
+
+        with open(image_path, 'rb') as f:
+            buffer.write(f.read())
+
+        return buffer
+
+    @staticmethod
+    def _composite_on_white(img: Image.Image) -> Image.Image:
+        """Flatten an RGBA, LA or palette image onto a white RGB background."""
+        # Create white background
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        if img.mode == 'P':
+            img = img.convert('RGBA')
+        # An RGBA/LA image used as its own mask blends with its alpha band
+        # directly, without split() copying out every band first
+        background.paste(img, mask=img)
+        return background
 
     def get_stats_summary(self) -> Dict[str, any]:
         """
@@ -249,6 +536,62 @@ class TextureProcessor:
         }
 
 
+def _check_jpeg_encoder():
+    """Warn if Pillow's JPEG codec isn't libjpeg-turbo."""
+    # libjpeg-turbo's SIMD DCT/Huffman coding is several times faster than
+    # stock libjpeg; the manylinux/Windows wheels ship it. warnings shows
+    # the message once per process, however many batches are run.
+    if not features.check_feature('libjpeg_turbo'):
+        warnings.warn("Pillow is not built with libjpeg-turbo; "
+                      "JPEG encoding will be slower", RuntimeWarning, stacklevel=3)
+
+
+def _process_one(image_path: Path,
+                 max_resolution: Optional[int],
+                 convert_to_webp: bool,
+                 jpeg_quality: int,
+                 webp_quality: int = 80) -> Tuple[dict, dict]:
+    """
+    Process a single texture (runs in a worker process).
+
+    Module-level so it can be pickled by ProcessPoolExecutor.
+
+    Returns:
+        Tuple of (process_texture result, processor stats)
+    """
+    processor = TextureProcessor(
+        max_resolution=max_resolution,
+        convert_to_webp=convert_to_webp,
+        jpeg_quality=jpeg_quality,
+        webp_quality=webp_quality
+    )
+    result = processor.process_texture(image_path)
+    return result, processor.stats
+
+
+def _estimate_jpeg_quality(img: Image.Image) -> int:
+    """
+    Estimate the IJG quality (1-100) a JPEG was saved at.
+
+    Exact (1-100) for files written with the standard tables, as libjpeg
+    and Pillow do. Custom tables are compared with the standard table by
+    their sum, which is within about 1 for qualities 20-99; below 20 the
+    table entries clip at 255, so the estimate comes out high (up to ~11).
+    """
+    table = img.quantization.get(0)
+    if not table:
+        return 100
+
+    quality = _JPEG_LUMA_QUALITIES.get(tuple(table))
+    if quality is not None:
+        return quality
+
+    scale = sum(table) * 100 / _JPEG_LUMA_TABLE_SUM
+    if scale <= 100:
+        return round((200 - scale) / 2)
+    return max(1, round(5000 / scale))
+
+
 def format_bytes(bytes: int) -> str:
     """Format bytes as human-readable string."""
     for unit in ['B', 'KB', 'MB', 'GB']:
@@ -0,0 +1,142 @@
+"""Unit tests for HTML viewer generation."""
+
+import json
+import os
+
+import pytest
+
+from modules import html_generator
+from modules.html_generator import HTMLGenerator
+
+OBJ_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head><title>Terra 3D Model Viewer (OBJ)</title></head>
+<body>
+<p>Modèle 3D</p>
+<script>
+const objData = `{{OBJ_DATA}}`;
+const mtlData = `{{MTL_DATA}}`;
+const textures = {{TEXTURE_DATA}};
+const other = '{{UNKNOWN}}';
+</script>
+</body>
+</html>
+"""
+
+PLY_TEMPLATE = """<html><head><title>Terra Point Cloud Viewer (PLY)</title></head>
+<script>const plyData = `{{PLY_DATA}}`;</script></html>
+"""
+
+OBJ_DATA = "# Café ${x} `quoted` C:\\models\\a.obj\nv 0 0 0\nf 1 1 1\n"
+MTL_DATA = "newmtl wall\nmap_Kd ${tex}\\wall.jpg\n"
+TEXTURES = {'wall.jpg': 'data:image/jpeg;base64,/9j/4AAQ', 'façade.png': 'data:image/png;base64,iVBO'}
+
+
+def _escape_js(text):
+    # Escaping as done before the streaming writer
+    return text.replace('\\', '\\\\').replace('`', '\\`').replace('${', '\\${')
+
+
+def _escape_html(text):
+    return (text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+            .replace('"', '&quot;').replace("'", '&#x27;'))
+
+
+def _render_obj(template, obj_data, mtl_data, textures, title):
+    # String-replace rendering as done before the streaming writer (texture
+    # JSON compact since orjson was adopted)
+    html = template.replace('{{OBJ_DATA}}', _escape_js(obj_data))
+    html = html.replace('{{MTL_DATA}}', _escape_js(mtl_data))
+    html = html.replace('{{TEXTURE_DATA}}',
+                        json.dumps(textures, ensure_ascii=False, separators=(',', ':')))
+    return html.replace('<title>Terra 3D Model Viewer (OBJ)</title>',
+                        f'<title>{_escape_html(title)}</title>')
+
+
+@pytest.fixture
+def template_dir(tmp_path):
+    templates = tmp_path / 'templates'
+    templates.mkdir()
+    (templates / 'viewer-obj.html').write_text(OBJ_TEMPLATE, encoding='utf-8')
+    (templates / 'viewer-ply.html').write_text(PLY_TEMPLATE, encoding='utf-8')
+    return templates
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_obj_viewer_matches_string_rendering(template_dir, tmp_path, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(html_generator, 'orjson', None)
+    elif html_generator.orjson is None:
+        pytest.skip("orjson not installed")
+    output = tmp_path / 'out' / 'viewer.html'
+
+    path, size = HTMLGenerator(template_dir).generate_obj_viewer(
+        OBJ_DATA, MTL_DATA, TEXTURES, output, title="Site <A> & 'B'")
+
+    expected = _render_obj(OBJ_TEMPLATE, OBJ_DATA, MTL_DATA, TEXTURES, "Site <A> & 'B'")
+    assert path == output
+    assert output.read_bytes() == expected.encode('utf-8')
+    assert size == output.stat().st_size
+
+
+@pytest.mark.parametrize('chunk_size', range(1, 8))
+def test_escapes_across_chunk_boundaries(template_dir, tmp_path, monkeypatch, chunk_size):
+    # Escape sequences and '${' land on every position relative to a chunk
+    # boundary as the chunk size varies
+    obj_data = "a${b\\c`d$${e$$f\\\\${`${\n$"
+    monkeypatch.setattr(HTMLGenerator, '_JS_ESCAPE_CHUNK_SIZE', chunk_size)
+    output = tmp_path / 'viewer.html'
+
+    HTMLGenerator(template_dir).generate_obj_viewer(obj_data, '', {}, output, title="T")
+
+    expected = _render_obj(OBJ_TEMPLATE, obj_data, '', {}, "T")
+    assert output.read_text(encoding='utf-8') == expected
+
+
+def test_ply_viewer_matches_string_rendering(template_dir, tmp_path):
+    ply_data = "ply\ncomment ${x} `y` \\z\nend_header\n"
+    output = tmp_path / 'points.html'
+
+    path, size = HTMLGenerator(template_dir).generate_ply_viewer(ply_data, output, title="Points")
+
+    expected = (PLY_TEMPLATE
+                .replace('{{PLY_DATA}}', _escape_js(ply_data))
+                .replace('<title>Terra Point Cloud Viewer (PLY)</title>', '<title>Points</title>'))
+    assert output.read_text(encoding='utf-8') == expected
+    assert size == len(expected.encode('utf-8'))
+
+
+def test_title_tag_in_model_data_is_not_replaced(template_dir, tmp_path):
+    obj_data = "# <title>Terra 3D Model Viewer (OBJ)</title>\n"
+    output = tmp_path / 'viewer.html'
+
+    HTMLGenerator(template_dir).generate_obj_viewer(obj_data, '', {}, output, title="New")
+
+    html = output.read_text(encoding='utf-8')
+    assert '<head><title>New</title></head>' in html
+    assert obj_data in html
+
+
+def test_template_change_is_picked_up(template_dir, tmp_path):
+    generator = HTMLGenerator(template_dir)
+    output = tmp_path / 'points.html'
+    generator.generate_ply_viewer('a', output, title='')
+
+    template = template_dir / 'viewer-ply.html'
+    template.write_text('<p>{{PLY_DATA}}</p>', encoding='utf-8')
+    stat = template.stat()
+    # Make sure the modification time differs even on coarse-grained clocks
+    os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    generator.generate_ply_viewer('b', output, title='')
+
+    assert output.read_text(encoding='utf-8') == '<p>b</p>'
+
+
+def test_default_is_shared_per_class():
+    class CustomGenerator(HTMLGenerator):
+        pass
+
+    assert HTMLGenerator.default() is HTMLGenerator.default()
+    assert type(HTMLGenerator.default()) is HTMLGenerator
+    assert type(CustomGenerator.default()) is CustomGenerator
+    assert CustomGenerator.default() is CustomGenerator.default()
@@ -0,0 +1,95 @@
+"""Unit tests for the MTL parser."""
+
+from modules.mtl_parser import Material, MTLParser
+
+
+MTL = """\
+newmtl stone
+Kd 0.8 0.8 0.8
+map_Kd textures/stone.jpg
+map_Bump stone_bump.png
+
+newmtl roof
+map_Kd roof.jpg
+"""
+
+
+def test_update_texture_paths_parsed_materials():
+    parser = MTLParser()
+    parser.parse_string(MTL)
+
+    parser.update_texture_paths({'textures/stone.jpg': 'data:image/jpeg;base64,AA=='})
+
+    assert parser.materials['stone'].map_diffuse == 'data:image/jpeg;base64,AA=='
+    assert parser.materials['stone'].map_bump == 'stone_bump.png'
+    assert parser.materials['roof'].map_diffuse == 'roof.jpg'
+
+
+def test_update_texture_paths_material_added_in_code():
+    parser = MTLParser()
+    parser.parse_string(MTL)
+
+    material = Material('glass')
+    material.map_alpha = 'roof.jpg'
+    parser.materials['glass'] = material
+
+    parser.update_texture_paths({'roof.jpg': 'data:image/jpeg;base64,AA=='})
+
+    assert material.map_alpha == 'data:image/jpeg;base64,AA=='
+    assert parser.materials['roof'].map_diffuse == 'data:image/jpeg;base64,AA=='
+
+
+def test_update_texture_paths_without_parsing():
+    parser = MTLParser()
+    material = Material('plain')
+    material.map_diffuse = 'a.jpg'
+    parser.materials['plain'] = material
+
+    parser.update_texture_paths({'a.jpg': 'data:image/jpeg;base64,AA=='})
+
+    assert material.map_diffuse == 'data:image/jpeg;base64,AA=='
+
+
+def test_update_texture_paths_attribute_changed_after_parsing():
+    parser = MTLParser()
+    parser.parse_string(MTL)
+    parser.materials['roof'].map_diffuse = 'new_roof.jpg'
+
+    parser.update_texture_paths({'roof.jpg': 'data:old', 'new_roof.jpg': 'data:new'})
+
+    assert parser.materials['roof'].map_diffuse == 'data:new'
+
+
+def test_update_texture_paths_chained_mapping_applied_once():
+    parser = MTLParser()
+    parser.parse_string(MTL)
+
+    parser.update_texture_paths({'roof.jpg': 'stone_bump.png',
+                                 'stone_bump.png': 'data:image/png;base64,AA=='})
+
+    assert parser.materials['roof'].map_diffuse == 'stone_bump.png'
+    assert parser.materials['stone'].map_bump == 'data:image/png;base64,AA=='
+
+
+def test_update_texture_paths_skips_removed_material():
+    parser = MTLParser()
+    parser.parse_string(MTL)
+    roof = parser.materials.pop('roof')
+
+    parser.update_texture_paths({'roof.jpg': 'data:image/jpeg;base64,AA=='})
+
+    assert roof.map_diffuse == 'roof.jpg'
+
+
+def test_update_texture_paths_repeated_and_cleared_maps():
+    parser = MTLParser()
+    parser.parse_string(MTL)
+    stone = parser.materials['stone']
+
+    parser.update_texture_paths({'stone_bump.png': 'bump2.png'})
+    stone.map_diffuse = None
+    parser.update_texture_paths({'bump2.png': 'data:bump', 'textures/stone.jpg': 'data:stone'})
+
+    assert stone.map_bump == 'data:bump'
+    assert stone.map_diffuse is None
+    assert 'textures/stone.jpg' not in parser._texture_index
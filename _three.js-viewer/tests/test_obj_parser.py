@@ -0,0 +1,54 @@
+"""Unit tests for the OBJ parser."""
+
+from modules.obj_parser import OBJParser
+
+
+def test_join_continued_lines():
+    lines = [b'f 1 2 \\', b'  3', b'v 0 0 0', b'vt 0.5 \\', b'0.5']
+
+    assert list(OBJParser._join_continued_lines(lines)) == [
+        b'f 1 2  3', b'v 0 0 0', b'vt 0.5  0.5',
+    ]
+
+
+def test_join_continued_lines_over_several_lines():
+    lines = [b'f 1 \\', b'2 \\', b'3']
+
+    assert list(OBJParser._join_continued_lines(lines)) == [b'f 1  2  3']
+
+
+def test_join_continued_lines_continuation_on_last_line():
+    assert list(OBJParser._join_continued_lines([b'v 1 2 3', b'g top \\'])) == [
+        b'v 1 2 3', b'g top  ',
+    ]
+
+
+def test_parse_files_merges_continued_faces(tmp_path):
+    first = tmp_path / 'a.obj'
+    second = tmp_path / 'b.obj'
+    first.write_bytes(b'v 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 \\\n  3\n')
+    second.write_bytes(b'v 0 0 \\\r\n 1\r\nv 1 0 1\r\nv 0 1 1\r\nf 1 \\\r\n2 3\r\n')
+
+    parser = OBJParser()
+    merged = parser.parse_files([first, second])
+
+    assert merged.splitlines() == [
+        'v 0 0 0', 'v 1 0 0', 'v 0 1 0', 'f 1 2 3',
+        '# === File 2: b.obj ===',
+        'v 0 0  1', 'v 1 0 1', 'v 0 1 1', 'f 4 5 6',
+    ]
+    stats = parser.get_stats()
+    assert stats['vertices'] == 6
+    assert stats['faces'] == 2
+
+
+def test_parse_file_counts_continued_lines_once(tmp_path):
+    obj_path = tmp_path / 'model.obj'
+    obj_path.write_bytes(b'v 0 0 \\\n 1\nv 1 0 1\nv 0 1 1\nf 1 \\\n2 3\n')
+
+    parser = OBJParser()
+    parser.parse_file(obj_path)
+
+    stats = parser.get_stats()
+    assert stats['vertices'] == 3
+    assert stats['faces'] == 1
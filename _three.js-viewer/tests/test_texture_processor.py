@@ -0,0 +1,162 @@
+"""Unit tests for texture processing."""
+
+import base64
+import io
+
+import pytest
+from PIL import ExifTags, Image
+
+from modules.texture_processor import TextureProcessor, _estimate_jpeg_quality
+
+
+def _decode_data_uri(data_uri):
+    header, data = data_uri.split(',', 1)
+    return header, base64.b64decode(data)
+
+
+def _save(path, format, **kwargs):
+    Image.new('RGB', (32, 16), (200, 120, 40)).save(path, format=format, **kwargs)
+    return path
+
+
+def test_jpeg_at_or_below_quality_is_embedded_unchanged(tmp_path):
+    jpg = _save(tmp_path / 'tex.jpg', 'JPEG', quality=70)
+
+    result = TextureProcessor(jpeg_quality=85).process_texture(jpg)
+
+    header, data = _decode_data_uri(result['data_uri'])
+    assert header == 'data:image/jpeg;base64'
+    assert data == jpg.read_bytes()
+
+
+def test_jpeg_above_quality_is_reencoded(tmp_path):
+    jpg = _save(tmp_path / 'tex.jpg', 'JPEG', quality=98)
+
+    result = TextureProcessor(jpeg_quality=60).process_texture(jpg)
+
+    header, data = _decode_data_uri(result['data_uri'])
+    assert header == 'data:image/jpeg;base64'
+    assert data != jpg.read_bytes()
+    assert Image.open(io.BytesIO(data)).format == 'JPEG'
+
+
+@pytest.mark.parametrize('quality', [1, 10, 19, 20, 50, 99, 100])
+def test_estimate_jpeg_quality_standard_tables(tmp_path, quality):
+    jpg = _save(tmp_path / 'tex.jpg', 'JPEG', quality=quality)
+
+    assert _estimate_jpeg_quality(Image.open(jpg)) == quality
+
+
+@pytest.mark.parametrize('quality', [20, 50, 99])
+def test_estimate_jpeg_quality_custom_table(tmp_path, quality):
+    # A standard table with one entry changed no longer matches exactly
+    table = list(Image.open(_save(tmp_path / 'std.jpg', 'JPEG', quality=quality)).quantization[0])
+    table[63] += 1
+    jpg = _save(tmp_path / 'tex.jpg', 'JPEG', qtables=[table])
+
+    assert abs(_estimate_jpeg_quality(Image.open(jpg)) - quality) <= 1
+
+
+def test_rotated_jpeg_is_reencoded(tmp_path):
+    exif = Image.Exif()
+    exif[ExifTags.Base.Orientation] = 6  # Rotate 90 degrees clockwise to display
+    jpg = _save(tmp_path / 'tex.jpg', 'JPEG', quality=70, exif=exif)
+
+    result = TextureProcessor(jpeg_quality=85).process_texture(jpg)
+
+    header, data = _decode_data_uri(result['data_uri'])
+    assert data != jpg.read_bytes()
+    assert ExifTags.Base.Orientation not in Image.open(io.BytesIO(data)).getexif()
+
+
+def test_upright_jpeg_with_exif_is_embedded_unchanged(tmp_path):
+    exif = Image.Exif()
+    exif[ExifTags.Base.Orientation] = 1
+    jpg = _save(tmp_path / 'tex.jpg', 'JPEG', quality=70, exif=exif)
+
+    result = TextureProcessor(jpeg_quality=85).process_texture(jpg)
+
+    assert _decode_data_uri(result['data_uri'])[1] == jpg.read_bytes()
+
+
+def test_png_is_reencoded(tmp_path):
+    png = _save(tmp_path / 'tex.png', 'PNG', compress_level=0)
+
+    result = TextureProcessor().process_texture(png)
+
+    header, data = _decode_data_uri(result['data_uri'])
+    assert header == 'data:image/png;base64'
+    assert Image.open(io.BytesIO(data)).format == 'PNG'
+    assert len(data) < png.stat().st_size
+
+
+def test_png_with_jpg_suffix_is_reencoded_as_jpeg(tmp_path):
+    fake_jpg = _save(tmp_path / 'tex.jpg', 'PNG')
+
+    result = TextureProcessor().process_texture(fake_jpg)
+
+    header, data = _decode_data_uri(result['data_uri'])
+    assert header == 'data:image/jpeg;base64'
+    assert Image.open(io.BytesIO(data)).format == 'JPEG'
+
+
+def test_jpeg_with_png_suffix_is_reencoded_as_png(tmp_path):
+    fake_png = _save(tmp_path / 'tex.png', 'JPEG', quality=50)
+
+    result = TextureProcessor().process_texture(fake_png)
+
+    header, data = _decode_data_uri(result['data_uri'])
+    assert header == 'data:image/png;base64'
+    assert Image.open(io.BytesIO(data)).format == 'PNG'
+
+
+def test_passthrough_to_stream_matches_data_uri(tmp_path):
+    jpg = _save(tmp_path / 'tex.jpg', 'JPEG', quality=70)
+    processor = TextureProcessor()
+
+    expected = processor.process_texture(jpg)['data_uri']
+    out = io.BytesIO()
+    result = processor.process_texture(jpg, out_stream=out)
+
+    assert 'data_uri' not in result
+    assert out.getvalue().decode('ascii') == expected
+    assert result['encoded_size'] == len(expected)
+
+
+def test_downscale_16_bit_greyscale_png(tmp_path):
+    png = tmp_path / 'height.png'
+    Image.new('I;16', (256, 64), 1000).save(png)
+
+    result = TextureProcessor(max_resolution=64).process_texture(png)
+
+    assert result['downscaled']
+    assert result['dimensions'] == (64, 16)
+    header, data = _decode_data_uri(result['data_uri'])
+    assert header == 'data:image/png;base64'
+    assert Image.open(io.BytesIO(data)).size == (64, 16)
+
+
+def test_settings_changed_after_init_are_used(tmp_path):
+    jpg = _save(tmp_path / 'tex.jpg', 'JPEG', quality=70)
+    processor = TextureProcessor()
+
+    processor.convert_to_webp = True
+    result = processor.process_texture(jpg)
+
+    header, data = _decode_data_uri(result['data_uri'])
+    assert header == 'data:image/webp;base64'
+    assert Image.open(io.BytesIO(data)).format == 'WEBP'
+
+
+def test_batch_records_or_raises_errors(tmp_path):
+    paths = [_save(tmp_path / f'tex{i}.jpg', 'JPEG', quality=70) for i in range(3)]
+    paths.insert(1, tmp_path / 'missing.jpg')
+
+    results = TextureProcessor().process_textures_batch(paths)
+
+    assert list(results) == ['tex0.jpg', 'missing.jpg', 'tex1.jpg', 'tex2.jpg']
+    assert 'error' in results['missing.jpg']
+    assert results['tex2.jpg']['format'] == 'jpeg'
+
+    with pytest.raises(FileNotFoundError):
+        TextureProcessor().process_textures_batch(paths, raise_errors=True)